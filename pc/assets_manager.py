@@ -4,14 +4,27 @@ Gestion du chargement et du traitement des assets (images, sprites)
 """
 
 import os
+import queue
+import threading
+from collections import OrderedDict
+import numpy as np
 from PIL import Image, ImageTk
-from constants import BIRD_RADIUS, MODE_PIPE_SKINS
+from constants import (
+    BIRD_RADIUS, MODE_PIPE_SKINS, PIPE_WIDTH, COLORKEY, COLORKEY_TOL, SPRITE_CACHE_DIR,
+    PIPE_SKIN_BUDGET_MB
+)
+from texture_cache import TextureCache
+from sprite_cache import SpriteCache
+from atlas import Atlas
 
 
 class AssetsManager:
     "Classe responsable du chargement et de la gestion des assets"
     
-    def __init__(self):
+    def __init__(self, headless=False):
+        # headless : images PIL seulement, aucune PhotoImage (export vidéo sans Tk)
+        self.headless = headless
+        
         self._bird_src = None
         self._bird_tk = None
 
@@ -19,113 +32,341 @@ class AssetsManager:
         self._bird_crash_tk = None
         
         self._bg_src = None
-        self._bg_tk = None
-        self._bg_size = None
+        self._bg_thumb = None      # vignette pour le remplaçant flou
+        self._bg_shown = None      # dernier fond complet retourné
+        self._bg_placeholder = None
+        
+        # Tuyaux chargés à la demande, du mode le moins au plus récemment utilisé
+        self._pipe_tex_cache = OrderedDict()
+        self._pipe_tk_cache = {}  # PhotoImage partagées par mode (taille d'origine)
+        self.pipe_budget = PIPE_SKIN_BUDGET_MB * 1024 * 1024
+        self.pipe_nbytes = 0
+        self._pipe_wanted = None   # mode sélectionné
+        self._pipe_in_use = None   # mode affiché par les tuyaux
+        
+        # Textures redimensionnées (fond, tuyaux) : LRU borné, redimensionnement en thread
+        self.textures = TextureCache(self._photo)
+        
+        # Sprites traités (colorkey, taille) gardés sur disque entre deux lancements
+        self.sprites = SpriteCache(os.path.join(os.path.dirname(__file__), SPRITE_CACHE_DIR))
         
-        self._pipe_tex_cache = {}
+        # Atlas des tuyaux et de l'oiseau (python atlas.py) : un décodage, des découpes
+        self.atlas = Atlas.open(self.get_asset_path(""), self._load_atlas_image, self.sprites.directory)
+        
+        # Chargement en arrière-plan : (type, argument) à décoder, résultats pour le thread Tk
+        self._jobs = []
+        self._jobs_lock = threading.Lock()
+        self._worker_running = False
+        self._loaded = queue.Queue()
+        self._pending = set()  # demandés, pas encore installés (thread Tk)
+        self._done = set()     # assets installés : "bird", "background", "bird_crash"
     
     @staticmethod
     def get_asset_path(name: str) -> str:
         "Retourne le chemin complet vers un asset"
         return os.path.join(os.path.dirname(__file__), "assets", name)
     
+    def _photo(self, img):
+        "PhotoImage de l'image (None en mode headless)"
+        return None if self.headless else ImageTk.PhotoImage(img)
+    
     @staticmethod
     def colorkey_rgba(img, key=(255, 0, 255), tol=40):
         "Remplace la couleur 'key' par de la transparence (rendre les rectangles et l oval invisible)"
-        img = img.convert("RGBA")
-        px = img.load()
-        w, h = img.size
-        kr, kg, kb = key
-        
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[x, y]
-                if abs(r - kr) <= tol and abs(g - kg) <= tol and abs(b - kb) <= tol:
-                    px[x, y] = (r, g, b, 0)  # alpha = 0
-        return img
+        px = np.array(img.convert("RGBA"))
+        
+        # |c - k| <= tol  <=>  k - tol <= c <= k + tol : comparaisons uint8 sur toute l'image
+        mask = None
+        for c, k in enumerate(key):
+            chan = px[..., c]
+            near = (chan >= max(0, k - tol)) & (chan <= min(255, k + tol))
+            mask = near if mask is None else mask & near
+        px[..., 3][mask] = 0  # alpha = 0
+        return Image.fromarray(px, "RGBA")
     
-    def load_bird_sprite(self, sprite_name: str):
-        "Charge le sprite de l'oiseau"
+    def _load_atlas_image(self, path):
+        "Image de l'atlas (pixels bruts du cache disque après le premier lancement)"
+        return self.sprites.load(path, ("rgba",), lambda: Image.open(path).convert("RGBA"))
+    
+    def _load_sprite(self, name: str, size=None):
+        "Sprite détouré (et redimensionné) : atlas, sinon cache disque, sinon recalculé"
+        if self.atlas is not None:
+            img = self.atlas.get(name, size)
+            if img is not None:
+                return img
+        
+        path = self.get_asset_path(name)
+        
+        def build():
+            img = self.colorkey_rgba(Image.open(path), key=COLORKEY, tol=COLORKEY_TOL)
+            if size is not None:
+                img = img.resize(size, Image.LANCZOS)
+            return img
+        
+        return self.sprites.load(path, ("colorkey", COLORKEY, COLORKEY_TOL, size, "lanczos"), build)
+    
+    # ==================== Chargement ====================
+    
+    def _decode(self, kind: str, arg=None):
+        "Décode et traite un asset sans Tk (utilisable depuis le thread de chargement)"
+        if kind == "pipes":
+            return self._decode_pipes(arg)
         try:
-            img = Image.open(self.get_asset_path(sprite_name)).convert("RGBA")
-            img = self.colorkey_rgba(img, key=(255, 0, 255), tol=40)
-            
+            if kind == "background":
+                path = self.get_asset_path("background.png")
+                src = self.sprites.load(path, ("rgb",), lambda: Image.open(path).convert("RGB"))
+                thumb = src.resize((max(1, src.width // 8), max(1, src.height // 8)), Image.BILINEAR)
+                return src, thumb
             size = BIRD_RADIUS * 2
-            img = img.resize((size, size), Image.LANCZOS)
-            self._bird_src = img
-            self._bird_tk = ImageTk.PhotoImage(img)
+            return self._load_sprite(arg, (size, size))
         except Exception as e:
-            print(f"[BIRD] Impossible de charger le sprite: {e}")
-            self._bird_src = None
-            self._bird_tk = None
+            if kind == "background":
+                print(f"[MENU BG] Impossible de charger l'image: {e}")
+            elif kind == "bird_crash":
+                print(f"[BIRD-CRASH] Impossible de charger le sprite: {e}")
+            else:
+                print(f"[BIRD] Impossible de charger le sprite: {e}")
+            return None
+    
+    def _decode_pipes(self, mode: str):
+        "Textures (haut, bas) d'un mode, None pour celles qui manquent"
+        top_rel, bot_rel = MODE_PIPE_SKINS[mode]
+        top_img = bot_img = None
+        
+        try:
+            top_img = self._load_sprite(top_rel)
+        except Exception as e:
+            print(f"[PIPE] Load top failed for {mode}: {e}")
+        
+        try:
+            bot_img = self._load_sprite(bot_rel)
+        except Exception as e:
+            print(f"[PIPE] Load bottom failed for {mode}: {e}")
+        
+        return top_img, bot_img
+    
+    def _install(self, kind: str, arg, result):
+        "Installe un asset décodé (thread Tk : création des PhotoImage)"
+        if kind == "bird":
+            self._bird_src = result
+            self._bird_tk = self._photo(result) if result is not None else None
+        elif kind == "bird_crash":
+            self._bird_crash_src = result
+            self._bird_crash_tk = self._photo(result) if result is not None else None
+        elif kind == "background":
+            self._bg_src, self._bg_thumb = result or (None, None)
+            self._bg_shown = self._bg_placeholder = None
+        elif kind == "pipes":
+            if arg in self._pipe_tex_cache:
+                self.pipe_nbytes -= self._pipe_nbytes(arg)
+            self._pipe_tex_cache[arg] = result
+            self._pipe_tk_cache.pop(arg, None)  # PhotoImage des textures remplacées
+            self.pipe_nbytes += self._pipe_nbytes(arg)
+            self._evict_pipes(keep=arg)
+            return
+        self._done.add(kind)
+    
+    def load_bird_sprite(self, sprite_name: str):
+        "Charge le sprite de l'oiseau"
+        self._install("bird", sprite_name, self._decode("bird", sprite_name))
 
     def load_bird_crash_sprite(self, sprite_name: str):
         "Charge le sprite de l'oiseau crashé pour le game over"
-        try:
-            img = Image.open(self.get_asset_path(sprite_name)).convert("RGBA")
-            img = self.colorkey_rgba(img, key=(255, 0, 255), tol=40)
-            size = BIRD_RADIUS * 2
-            img = img.resize((size, size), Image.LANCZOS)
-            self._bird_crash_src = img
-            self._bird_crash_tk = ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"[BIRD-CRASH] Impossible de charger le sprite: {e}")
-            self._bird_crash_src = None
-            self._bird_crash_tk = None
+        self._install("bird_crash", sprite_name, self._decode("bird_crash", sprite_name))
     
     def load_background(self):
         "Charge le fond d'écran"
-        try:
-            self._bg_src = Image.open(
-                self.get_asset_path("background.png")
-            ).convert("RGB")
-        except Exception as e:
-            print(f"[MENU BG] Impossible de charger l'image: {e}")
-            self._bg_src = None
+        self._install("background", None, self._decode("background"))
+    
+    def load_pipe_textures(self, mode: str):
+        "Charge les textures de tuyaux d'un mode (sans thread)"
+        self._install("pipes", mode, self._decode_pipes(mode))
+    
+    # ==================== Chargement en arrière-plan ====================
+    
+    def start_loading(self, bird_name: str, crash_name: str, first_mode=None):
+        """
+        Charge l'oiseau, le fond et les tuyaux du mode sélectionné dans un thread.
+        Les images décodées sont installées par poll_loading() (thread Tk).
+        Les tuyaux des autres modes sont chargés à la demande (request_pipes).
+        """
+        self._submit(("bird", bird_name))
+        self._submit(("background", None))
+        if first_mode in MODE_PIPE_SKINS:
+            self.request_pipes(first_mode)
+        self._submit(("bird_crash", crash_name))
+    
+    @property
+    def loading(self) -> bool:
+        "Des assets demandés ne sont pas encore installés"
+        return bool(self._pending)
+    
+    def _submit(self, job, first=False):
+        "Ajoute un asset à décoder (thread Tk) et démarre le thread si besoin"
+        if job in self._pending:
+            if first:
+                self._move_first(job)
+            return
+        self._pending.add(job)
+        with self._jobs_lock:
+            if first:
+                self._jobs.insert(self._first_slot(), job)
+            else:
+                self._jobs.append(job)
+            if not self._worker_running:
+                self._worker_running = True
+                threading.Thread(target=self._load_worker, name="assets", daemon=True).start()
+    
+    def _first_slot(self) -> int:
+        "Position prioritaire : après l'oiseau et le fond s'ils restent à charger"
+        i = 0
+        while i < len(self._jobs) and self._jobs[i][0] in ("bird", "background"):
+            i += 1
+        return i
+    
+    def _move_first(self, job):
+        with self._jobs_lock:
+            if job in self._jobs:  # sinon déjà en cours de décodage
+                self._jobs.remove(job)
+                self._jobs.insert(self._first_slot(), job)
+    
+    def _load_worker(self):
+        "Thread de chargement : décode les assets un par un (aucun appel Tk)"
+        while True:
+            with self._jobs_lock:
+                if not self._jobs:
+                    self._worker_running = False
+                    # Plus rien à découper : l'atlas n'est pas gardé en mémoire
+                    if self.atlas is not None:
+                        self.atlas.release()
+                    return
+                kind, arg = self._jobs.pop(0)
+            self._loaded.put((kind, arg, self._decode(kind, arg)))
+    
+    def poll_loading(self) -> bool:
+        "Installe les assets décodés depuis le dernier appel (thread Tk). True si du nouveau"
+        changed = False
+        while True:
+            try:
+                kind, arg, result = self._loaded.get_nowait()
+            except queue.Empty:
+                return changed
+            self._pending.discard((kind, arg))
+            self._install(kind, arg, result)
+            changed = True
+    
+    def is_ready(self, mode: str) -> bool:
+        "Oiseau et tuyaux du mode chargés (partie jouable)"
+        return "bird" in self._done and mode in self._pipe_tex_cache
+    
+    # ==================== Tuyaux à la demande ====================
+    
+    def request_pipes(self, mode: str):
+        "Tuyaux du mode voulus maintenant (mode sélectionné) : chargés en priorité"
+        if mode not in MODE_PIPE_SKINS:
+            return
+        self._pipe_wanted = mode
+        if mode in self._pipe_tex_cache:
+            self._pipe_tex_cache.move_to_end(mode)
+        else:
+            self._submit(("pipes", mode), first=True)
+    
+    def prefetch_pipes(self, modes):
+        "Tuyaux probablement utilisés bientôt (temps libre du menu) : en fin de file"
+        for mode in modes:
+            if mode in MODE_PIPE_SKINS and mode not in self._pipe_tex_cache:
+                self._submit(("pipes", mode))
+    
+    def _pipe_nbytes(self, mode: str) -> int:
+        return sum(img.width * img.height * 4 for img in self._pipe_tex_cache[mode] if img is not None)
+    
+    def _evict_pipes(self, keep):
+        "Libère les tuyaux des modes les moins récemment utilisés au-delà du budget"
+        protected = {keep, self._pipe_wanted, self._pipe_in_use}
+        for mode in list(self._pipe_tex_cache):
+            if self.pipe_nbytes <= self.pipe_budget:
+                break
+            if mode in protected:
+                continue
+            self.pipe_nbytes -= self._pipe_nbytes(mode)
+            del self._pipe_tex_cache[mode]
+            self._pipe_tk_cache.pop(mode, None)
+            self.textures.drop_mode(mode)
+            print(f"[PIPE] Textures {mode} libérées ({self.pipe_nbytes // 1024} Kio gardés)")
     
     def get_background_image(self, bg_type: str, width: int, height: int):
-        "Retourne l'image de fond redimensionnée"
-       
+        "Retourne l'image de fond redimensionnée (remplaçant tant que le redimensionnement tourne)"
         src = self._bg_src
-        if getattr(self, "_bg_size", None) != (width, height):
-            if src:
-                img = src.resize((width, height), Image.LANCZOS)
-                self._bg_tk = ImageTk.PhotoImage(img)
-                self._bg_size = (width, height)
-        return self._bg_tk
+        if src is None:
+            return None
+        
+        size = (width, height)
+        photo = self.textures.get(
+            ("background", size, False, None), lambda: src.resize(size, Image.LANCZOS)
+        )
+        if photo is not None:
+            self._bg_shown = photo
+            return photo
+        
+        # Remplaçant : l'ancien fond, sinon la vignette agrandie (quelques ms)
+        if self._bg_shown is not None:
+            return self._bg_shown
+        if self._bg_placeholder is None or self._bg_placeholder[0] != size:
+            self._bg_placeholder = (size, self._photo(self._bg_thumb.resize(size, Image.NEAREST)))
+        return self._bg_placeholder[1]
+    
+    def poll_textures(self) -> bool:
+        "Intègre les textures redimensionnées en thread. True si un rendu est à refaire"
+        return self.textures.poll()
 
     
-    def preload_pipe_textures(self):
-        "Charge les textures de tuyaux pour tous les modes"
-        for mode, (top_rel, bot_rel) in MODE_PIPE_SKINS.items():
-            top_img = bot_img = None
-            
-            try:
-                top_img = Image.open(self.get_asset_path(top_rel)).convert("RGBA")
-                top_img = self.colorkey_rgba(top_img, key=(255, 0, 255), tol=40)
-            except Exception as e:
-                print(f"[PIPE] Load top failed for {mode}: {e}")
-            
-            try:
-                bot_img = Image.open(self.get_asset_path(bot_rel)).convert("RGBA")
-                bot_img = self.colorkey_rgba(bot_img, key=(255, 0, 255), tol=40)
-            except Exception as e:
-                print(f"[PIPE] Load bottom failed for {mode}: {e}")
-            
-            self._pipe_tex_cache[mode] = (top_img, bot_img)
+    def _pipe_skin_mode(self, mode: str):
+        "Mode dont les textures sont affichées pour ce mode (repli sur Button, None si rien)"
+        for m in (mode, "Button"):
+            tpl = self._pipe_tex_cache.get(m)
+            if tpl and all(tpl):
+                return m
+        return None
     
     def get_pipe_textures(self, mode: str):
         "Retourne les textures de tuyaux en fonction du mode"
-        tpl = self._pipe_tex_cache.get(mode)
-        if tpl and all(tpl):
-            return tpl
+        skin = self._pipe_skin_mode(mode)
+        if skin is None:
+            return (None, None)
+        return self._pipe_tex_cache[skin]
+    
+    def get_pipe_photos(self, mode: str, height=None):
+        """
+        Retourne les PhotoImage (haut, bas) partagées par tous les tuyaux du mode.
+        Avec height, textures mises à la hauteur du terrain (taille d'origine en attendant).
+        """
+        # Mode jamais chargé (ou libéré) : demandé maintenant, repli en attendant
+        if mode not in self._pipe_tex_cache and ("pipes", mode) not in self._pending:
+            self.request_pipes(mode)
         
-        # Fallback sur le mode Button
-        tpl = self._pipe_tex_cache.get("Button")
-        if tpl and all(tpl):
-            return tpl
+        # Textures du mode (ou du repli) ; rien tant qu'elles sont en chargement
+        skin = self._pipe_skin_mode(mode)
+        if skin is None:
+            return (None, None)
+        if skin != self._pipe_in_use:
+            self._pipe_in_use = skin
+            self._pipe_tex_cache.move_to_end(skin)
+        pil_top, pil_bot = self._pipe_tex_cache[skin]
+        photos = self._pipe_tk_cache.get(skin)
+        if photos is None:
+            photos = self._pipe_tk_cache[skin] = (self._photo(pil_top), self._photo(pil_bot))
         
-        return (None, None)
+        if height is None:
+            return photos
+        size = (PIPE_WIDTH, int(height))
+        if pil_top.size == size and pil_bot.size == size:
+            return photos
+        
+        top = self.textures.get(("pipe_top", size, False, skin), lambda: pil_top.resize(size, Image.LANCZOS))
+        bot = self.textures.get(("pipe_bot", size, False, skin), lambda: pil_bot.resize(size, Image.LANCZOS))
+        if top is None or bot is None:
+            return photos
+        return (top, bot)
     
     @staticmethod
     def resize_pipe_texture(src_img, w, h, flip_vertical=False):
@@ -137,6 +378,16 @@ class AssetsManager:
         img = img.resize((int(w), int(h)), Image.LANCZOS)
         return ImageTk.PhotoImage(img)
     
+    @property
+    def bird_src(self):
+        "Image PIL (RGBA) de l'oiseau, à la taille d'affichage"
+        return self._bird_src
+    
+    @property
+    def background_src(self):
+        "Image PIL du fond d'écran (taille d'origine)"
+        return self._bg_src
+    
     @property
     def bird_tk(self):
         "Retourne l'image Tk de l'oiseau"
@@ -0,0 +1,221 @@
+# atlas.py
+"""
+Atlas de textures : sprites des tuyaux et de l'oiseau, déjà détourés (et
+mis à leur taille d'affichage), rangés dans une seule image + un index JSON
+des sous-rectangles. Au lancement, un seul décodage puis des découpes.
+
+Construction (à refaire quand un sprite ou COLORKEY / COLORKEY_TOL / BIRD_RADIUS change) :
+    python atlas.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from PIL import Image
+from constants import (
+    BIRD_RADIUS, BIRD_SPRITE, BIRD_CRASH_SPRITE, MODE_PIPE_SKINS, COLORKEY, COLORKEY_TOL
+)
+
+VERSION = 2  # v2 : empreinte SHA-1 des sources dans l'index
+ATLAS_IMAGE = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+ATLAS_STAMPS = "atlas_sources.json"  # cache local (non versionné) : date -> empreinte vérifiée
+MAX_WIDTH = 2048
+PADDING = 1  # pixels transparents entre deux sprites
+
+
+def sprite_key(name, size=None, flip=False):
+    "Clé d'un sprite dans l'index (nom d'asset + variante : taille, retournement)"
+    key = name
+    if size is not None:
+        key += f"@{size[0]}x{size[1]}"
+    if flip:
+        key += "@flip"
+    return key
+
+
+def default_sprites():
+    "Sprites chargés par AssetsManager : (nom, taille) — oiseaux à la taille d'affichage"
+    bird = (BIRD_RADIUS * 2, BIRD_RADIUS * 2)
+    sprites = [(BIRD_SPRITE, bird), (BIRD_CRASH_SPRITE, bird)]
+    for top, bot in MODE_PIPE_SKINS.values():
+        sprites += [(top, None), (bot, None)]
+    return sprites
+
+
+def source_sha1(path):
+    "Empreinte SHA-1 du contenu d'une source"
+    with open(path, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+# ==================== Construction (hors ligne) ====================
+
+def _pack(sizes, max_width=MAX_WIDTH):
+    "Rangement par étagères (plus hauts d'abord) : positions et taille de l'atlas"
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    pos = [None] * len(sizes)
+    x = y = shelf_h = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        pos[i] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+        width = max(width, x - PADDING)
+    return pos, (width, y + shelf_h)
+
+
+def build_atlas(directory, sprites=None, process=None):
+    "Construit atlas.png + atlas.json dans directory. Retourne le nombre de sprites"
+    from assets_manager import AssetsManager  # import local : assets_manager importe ce module
+
+    sprites = sprites or default_sprites()
+    if process is None:
+        def process(path, size):
+            img = AssetsManager.colorkey_rgba(Image.open(path), key=COLORKEY, tol=COLORKEY_TOL)
+            return img.resize(size, Image.LANCZOS) if size is not None else img
+
+    images = []
+    for name, size in sprites:
+        path = os.path.join(directory, name)
+        images.append((name, size, (os.path.getsize(path), source_sha1(path)), process(path, size)))
+
+    pos, atlas_size = _pack([img.size for _, _, _, img in images])
+    atlas = Image.new("RGBA", atlas_size, (0, 0, 0, 0))
+    entries = {}
+    for (name, size, (src_bytes, src_sha1), img), (x, y) in zip(images, pos):
+        atlas.paste(img, (x, y))
+        entries[sprite_key(name, size)] = {
+            "rect": [x, y, img.width, img.height],
+            "source": name,
+            "source_bytes": src_bytes,
+            "source_sha1": src_sha1,
+        }
+
+    index = {
+        "version": VERSION,
+        "image": ATLAS_IMAGE,
+        "size": list(atlas_size),
+        "colorkey": list(COLORKEY),
+        "tolerance": COLORKEY_TOL,
+        "sprites": entries,
+    }
+    atlas.save(os.path.join(directory, ATLAS_IMAGE), optimize=True)
+    with open(os.path.join(directory, ATLAS_INDEX), "w", encoding="utf-8") as fh:
+        json.dump(index, fh, indent=1)
+    return len(entries)
+
+
+# ==================== Lecture ====================
+
+class Atlas:
+    "Index de l'atlas ; l'image est décodée au premier découpage (une seule fois)"
+
+    def __init__(self, directory, index, load_image=None, stamps_dir=None):
+        self.directory = directory
+        self.index = index
+        self.sprites = index["sprites"]
+        self._load_image = load_image or (lambda path: Image.open(path).convert("RGBA"))
+        self._image = None
+        self._fresh = {}          # source -> encore à jour (vérifiée une fois)
+        # Empreintes déjà calculées sur cette machine : {source: [date ns, sha1]}
+        self._stamps_path = os.path.join(stamps_dir, ATLAS_STAMPS) if stamps_dir else None
+        self._stamps = self._read_stamps()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, directory, load_image=None, stamps_dir=None):
+        """
+        Atlas du dossier, ou None s'il est absent ou construit avec d'autres paramètres.
+        stamps_dir : dossier local où garder les empreintes des sources déjà vérifiées.
+        """
+        try:
+            with open(os.path.join(directory, ATLAS_INDEX), encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if index.get("version") != VERSION or tuple(index.get("colorkey", ())) != COLORKEY \
+                or index.get("tolerance") != COLORKEY_TOL:
+            print("[ATLAS] Atlas périmé (python atlas.py pour le reconstruire)")
+            return None
+        return cls(directory, index, load_image, stamps_dir)
+
+    def get(self, name, size=None, flip=False):
+        "Sprite découpé (copie), ou None s'il n'est pas dans l'atlas ou si sa source a changé"
+        entry = self.sprites.get(sprite_key(name, size, flip))
+        if entry is None:
+            return None
+        x, y, w, h = entry["rect"]
+        with self._lock:
+            if not self._is_fresh(entry):
+                return None
+            if self._image is None:
+                self._image = self._load_image(os.path.join(self.directory, self.index["image"]))
+            return self._image.crop((x, y, x + w, y + h))
+
+    def _is_fresh(self, entry):
+        "La source n'a pas changé depuis la construction (taille puis empreinte SHA-1)"
+        source = entry["source"]
+        fresh = self._fresh.get(source)
+        if fresh is None:
+            path = os.path.join(self.directory, source)
+            try:
+                st = os.stat(path)
+                fresh = st.st_size == entry["source_bytes"]
+                if fresh:
+                    # Empreinte relue du cache local tant que la date n'a pas bougé
+                    stamp = self._stamps.get(source)
+                    if stamp is None or stamp[0] != st.st_mtime_ns:
+                        stamp = self._stamps[source] = [st.st_mtime_ns, source_sha1(path)]
+                        self._write_stamps()
+                    fresh = stamp[1] == entry["source_sha1"]
+            except OSError:
+                fresh = True  # source absente : l'atlas suffit
+            self._fresh[source] = fresh
+        return fresh
+
+    # ==================== Empreintes locales ====================
+
+    def _read_stamps(self):
+        if self._stamps_path is None:
+            return {}
+        try:
+            with open(self._stamps_path, encoding="utf-8") as fh:
+                stamps = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return stamps if isinstance(stamps, dict) else {}
+
+    def _write_stamps(self):
+        "Écrit le cache d'empreintes (remplacement atomique, ignoré en cas d'erreur)"
+        if self._stamps_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._stamps_path), exist_ok=True)
+            tmp = f"{self._stamps_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(self._stamps, fh)
+            os.replace(tmp, self._stamps_path)
+        except OSError as e:
+            print(f"[ATLAS] Écriture des empreintes impossible: {e}")
+
+    def release(self):
+        "Libère l'image décodée (relue au prochain découpage)"
+        with self._lock:
+            self._image = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construit l'atlas des sprites (tuyaux + oiseau)")
+    parser.add_argument("--dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets"))
+    args = parser.parse_args()
+    n = build_atlas(args.dir)
+    print(f"[ATLAS] {n} sprites -> {os.path.join(args.dir, ATLAS_IMAGE)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# batch_sim.py
+"""
+Simulation vectorisée (NumPy) de milliers d'oiseaux sur le même parcours.
+Utilisée pour l'entraînement de l'IA et le réglage de la difficulté.
+"""
+
+import time
+import numpy as np
+from world import World
+from constants import (
+    WIDTH, HEIGHT, GRAVITY, FLAP_IMPULSE, MAX_VY,
+    BIRD_X, BIRD_RADIUS, SIM_TICK_MS
+)
+
+
+class BatchSimulator:
+    "Fait avancer une population d'oiseaux en une opération par tableau"
+
+    def __init__(self, n_birds: int, width=WIDTH, height=HEIGHT, gap=None, seed=None):
+        self.n_birds = n_birds
+        # Parcours de tuyaux partagé : même générateur que le vrai jeu
+        self.course = World(width, height, gap)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        "Nouvelle partie : tous les oiseaux au centre, premier tuyau placé"
+        n = self.n_birds
+        self.course.reset(seed)
+        self.course.spawn_pipe_pair(initial=True)
+
+        self.bird_y = np.full(n, float(self.course.height // 2))
+        self.vy = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.ticks_alive = np.zeros(n, dtype=np.int64)
+        self.tick = 0
+        self._update_pipe_columns()
+
+    def _update_pipe_columns(self):
+        "Copie les tuyaux du parcours dans des colonnes NumPy"
+        pipes = self.course.pipes
+        self.pipe_x1 = np.array([p.x for p in pipes], dtype=np.float64)
+        self.pipe_x2 = self.pipe_x1 + np.array([p.width for p in pipes], dtype=np.float64)
+        self.pipe_top_h = np.array([p.top_h for p in pipes], dtype=np.float64)
+        self.pipe_bot_y = np.array([p.bot_y for p in pipes], dtype=np.float64)
+
+    @property
+    def n_alive(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def next_pipe(self):
+        "Premier tuyau que l'oiseau n'a pas encore dépassé (ou None)"
+        for pipe in self.course.pipes:
+            if pipe.x + pipe.width >= BIRD_X - BIRD_RADIUS:
+                return pipe
+        return None
+
+    def collide_pipes(self, bird_y):
+        "Test cercle-rectangle de tous les oiseaux contre tous les tuyaux"
+        # Phase large : tuyaux dont l'étendue en x recouvre celle de l'oiseau
+        near = np.flatnonzero(
+            (self.pipe_x1 <= BIRD_X + BIRD_RADIUS) & (self.pipe_x2 >= BIRD_X - BIRD_RADIUS)
+        )
+        if near.size == 0:
+            return np.zeros(bird_y.shape, dtype=bool)
+
+        r2 = BIRD_RADIUS * BIRD_RADIUS
+        cy = np.trunc(bird_y)[:, None]  # même arrondi que int(bird_y)
+
+        # L'oiseau a un x fixe : la composante x ne dépend que du tuyau
+        dx = BIRD_X - np.clip(BIRD_X, self.pipe_x1[near], self.pipe_x2[near])
+        dx2 = dx * dx
+
+        # Tuyau du haut : rectangle [0, top_h]
+        dy_top = cy - np.clip(cy, 0.0, self.pipe_top_h[near])
+        # Tuyau du bas : rectangle [bot_y, height]
+        dy_bot = cy - np.clip(cy, self.pipe_bot_y[near], float(self.course.height))
+
+        hit = (dx2 + dy_top * dy_top <= r2) | (dx2 + dy_bot * dy_bot <= r2)
+        return hit.any(axis=1)
+
+    def step(self, flaps=None, dt_ms=SIM_TICK_MS) -> int:
+        "Avance d'un pas fixe. flaps : masque booléen des oiseaux qui sautent"
+        alive = self.alive
+        h = self.course.height
+
+        # Saut (entre deux pas, comme l'appui clavier dans le jeu)
+        if flaps is not None:
+            self.vy[flaps & alive] = FLAP_IMPULSE
+
+        # Gravité bornée à +/- MAX_VY
+        vy = np.clip(self.vy + GRAVITY, -MAX_VY, MAX_VY)
+        self.vy = np.where(alive, vy, self.vy)
+        self.bird_y = np.where(alive, self.bird_y + self.vy, self.bird_y)
+
+        # Collision avec les bords
+        out = (self.bird_y <= BIRD_RADIUS) | (self.bird_y >= h - BIRD_RADIUS)
+        alive &= ~out
+
+        # Tuyaux partagés par toute la population
+        scored = self.course.advance_pipes(dt_ms)
+        self._update_pipe_columns()
+        if scored:
+            self.score[alive] += scored
+
+        # Collision avec les tuyaux
+        alive &= ~self.collide_pipes(self.bird_y)
+
+        self.ticks_alive[alive] += 1
+        self.tick += 1
+        return self.n_alive
+
+
+def _benchmark(n_birds=10000, n_ticks=300):
+    "Compare le pas batch (n_birds) au pas d'un seul World"
+    sim = BatchSimulator(n_birds)
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    for _ in range(n_ticks):
+        sim.step(rng.random(n_birds) < 0.05)
+        if sim.n_alive == 0:
+            sim.reset()
+    batch_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+    world = World()
+    world.spawn_pipe_pair(initial=True)
+    t0 = time.perf_counter()
+    for _ in range(n_ticks):
+        world.step(SIM_TICK_MS)
+        if world.crashed:
+            world.reset()
+            world.spawn_pipe_pair(initial=True)
+    single_us = (time.perf_counter() - t0) / n_ticks * 1e6
+
+    print(f"Batch  {n_birds} oiseaux : {batch_us:8.1f} us/pas "
+          f"({batch_us / n_birds:.3f} us/oiseau)")
+    print(f"World  1 oiseau     : {single_us:8.1f} us/pas")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,81 @@
+# bench_colorkey.py
+"""
+Compare la transparence par clé de couleur vectorisée (AssetsManager.colorkey_rgba)
+à l'ancienne boucle pixel par pixel, sur les sprites livrés dans assets/.
+
+Exemple :
+    python bench_colorkey.py --repeat 5
+"""
+
+import argparse
+import time
+from PIL import Image
+from assets_manager import AssetsManager
+from constants import BIRD_SPRITE, BIRD_CRASH_SPRITE, MODE_PIPE_SKINS
+
+
+def colorkey_rgba_loop(img, key=(255, 0, 255), tol=40):
+    "Version d'origine (boucle Python sur img.load()), gardée comme référence"
+    img = img.convert("RGBA")
+    px = img.load()
+    w, h = img.size
+    kr, kg, kb = key
+
+    for y in range(h):
+        for x in range(w):
+            r, g, b, a = px[x, y]
+            if abs(r - kr) <= tol and abs(g - kg) <= tol and abs(b - kb) <= tol:
+                px[x, y] = (r, g, b, 0)
+    return img
+
+
+def _best_of(func, img, repeat):
+    "Meilleur temps (ms) sur repeat appels, et le dernier résultat"
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = func(img)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0, out
+
+
+def shipped_sprites():
+    "Sprites passés par colorkey_rgba au démarrage (oiseau, crash, tuyaux)"
+    names = [BIRD_SPRITE, BIRD_CRASH_SPRITE]
+    for top, bot in MODE_PIPE_SKINS.values():
+        names += [top, bot]
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la transparence par clé de couleur")
+    parser.add_argument("--repeat", type=int, default=3, help="mesures par image (meilleur temps)")
+    args = parser.parse_args()
+
+    total_loop = total_vec = 0.0
+    identical = True
+    print(f"{'asset':28} {'taille':>11} {'boucle ms':>10} {'numpy ms':>9} {'gain':>7}")
+    for name in shipped_sprites():
+        try:
+            img = Image.open(AssetsManager.get_asset_path(name)).convert("RGBA")
+        except OSError as e:
+            print(f"[BENCH] {name} ignoré: {e}")
+            continue
+
+        t_loop, ref = _best_of(colorkey_rgba_loop, img, args.repeat)
+        t_vec, out = _best_of(AssetsManager.colorkey_rgba, img, args.repeat)
+        same = ref.tobytes() == out.tobytes()
+        identical &= same
+        total_loop += t_loop
+        total_vec += t_vec
+        print(f"{name:28} {img.width:>5}x{img.height:<5} {t_loop:>10.1f} {t_vec:>9.2f} "
+              f"{t_loop / max(t_vec, 1e-9):>6.0f}x{'' if same else '  DIFFÉRENT'}")
+
+    print(f"{'total':28} {'':>11} {total_loop:>10.1f} {total_vec:>9.2f} "
+          f"{total_loop / max(total_vec, 1e-9):>6.0f}x")
+    print(f"[BENCH] Sorties identiques : {'oui' if identical else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
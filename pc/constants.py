@@ -5,8 +5,17 @@ Fichier contenant toutes les constantes du jeu Flappy Bird
 
 # -- Fenêtre --
 WIDTH, HEIGHT = 1080, 920 # Taille écran
-FPS_MS = 16 # 1000 ms / 16 = 60 FPS
+FPS_MS = 1000 / 60 # Période visée en ms : 60 FPS (cadence d'affichage, peut être baissée)
+MAX_RENDER_SKIP = 2 # Rendus sautés d'affilée au plus quand la boucle est en retard
+PACING_WINDOW = 120 # Intervalles gardés pour mesurer FPS et gigue (~2 s)
+SIM_TICK_MS = 1000.0 / 60 # Pas fixe de la simulation (indépendant de l'affichage)
+MAX_SIM_STEPS = 5 # Nombre max de pas rattrapés par frame (évite la spirale)
 BLINK_MS = 500 # Clignotement à 1 Hz (500ms visible + 500ms invisible)
+PROFILER_WINDOW = 300 # Frames gardées pour les percentiles du profileur (~5 s)
+PROFILER_HUD_EVERY = 15 # Rafraîchissement du HUD de performance (en frames)
+TEXTURE_CACHE_MB = 64 # Budget mémoire des textures redimensionnées (LRU)
+PIPE_SKIN_BUDGET_MB = 3.5 # Budget des textures de tuyaux par mode (~1 Mio par mode, LRU)
+PIPE_PREFETCH_MS = 400 # Sélection inchangée dans le menu : préchargement des modes voisins
 
 # -- Fichiers --
 BESTSCORE_FILE = "bestscore.txt" # Stockage meilleur score
@@ -23,6 +32,9 @@ SCORE_FONT = ("VT323", 48, "bold")
 BEST_COLOR = MENU_COLOR
 BEST_FONT = ("VT323", 22)
 
+PERF_HUD_COLOR = "#00FF66"
+PERF_HUD_FONT = ("VT323", 22)
+
 MENU_ITEM_COLOR = "#FFFFFF"
 MENU_ITEM_SELECTED_COLOR = MENU_COLOR
 
@@ -47,10 +59,15 @@ INFO_CLOSE_FONT = ("VT323", 25)
 
 # -- Animations --
 MENU_ANIMATION_SPEED = 2  # vitesse d'animation du menu
+MENU_REDRAW_EVERY = 5  # l'ancienne boucle redessinait le menu une frame sur 5 (vitesse du titre)
 
 # -- Replay --
 REPLAY_SPEED = 2.0  # Vitesse de lecture du replay (x2)
-MAX_REPLAY_FRAMES = 10000  # Nombre maximum de frames enregistrées
+REPLAY_RING_MINUTES = 10  # Durée conservée (tampon circulaire), None = illimité
+REPLAY_RING_FRAMES = (
+    int(REPLAY_RING_MINUTES * 60 * 1000 / SIM_TICK_MS) if REPLAY_RING_MINUTES else None
+)
+REPLAY_DIR = "replays"  # Replays sauvegardés à chaque game over
 
 # -- Modes de jeu --
 MODES = ["Button", "Infrared", "Digit_Encoder", "Ultrasound", "Quit"]
@@ -61,6 +78,9 @@ BIRD_X = 220
 BIRD_RADIUS = 70
 BIRD_SPRITE = "flappy.png"
 BIRD_CRASH_SPRITE = "flappy_crash.png"
+COLORKEY = (255, 0, 255) # Couleur rendue transparente dans les sprites (magenta)
+COLORKEY_TOL = 40 # Tolérance par canal autour de COLORKEY
+SPRITE_CACHE_DIR = ".sprite_cache" # Sprites traités (dans pc/), recalculés si l'asset ou ces constantes changent
 
 # -- Physique --
 GRAVITY = 1.5
@@ -80,6 +100,7 @@ PIPE_GAP_JITTER = 40    # +/- aléatoire autour de la cible (évite la monotonie
 PIPE_SPEED_BASE = 20.0
 PIPE_SPEED_MAX = 20.0
 PIPE_SPAWN_EVERY_MS = 1200
+PIPE_POOL_SIZE = 4 # Emplacements de tuyaux pré-créés sur le canvas
 
 # -- Sprite des tuyaux --
 MODE_PIPE_SKINS = {
@@ -3,17 +3,43 @@
 Gestion de l'état du jeu et des scores
 """
 
-import time
-from constants import (
-    MODES, DEFAULT_MODE,
-    PIPE_GAP_BASE, PIPE_SPEED_BASE, PIPE_SPAWN_EVERY_MS
-)
+from constants import MODES, DEFAULT_MODE
+from world import World
+
+
+class Watched:
+    "Attribut observé : les abonnés ne sont appelés que si la valeur change"
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__[self.slot]
+
+    def __set__(self, obj, value):
+        values = obj.__dict__
+        if self.slot in values and values[self.slot] == value:
+            return
+        values[self.slot] = value
+        for callback in obj._watchers.get(self.name, ()):
+            callback(value)
 
 
 class GameState:
     "Classe gérant l'état du jeu"
     
+    # Valeurs affichées par le HUD / le menu (mises à jour sur changement)
+    score = Watched()
+    best_score = Watched()
+    selected_mode = Watched()
+    replay_progress = Watched()
+    
     def __init__(self):
+        self._watchers = {}  # nom -> [callback(valeur)]
+        
         # État général
         self.state_name = "MENU"  # MENU | PLAYING | GAME_OVER | REPLAY
         self.menu_animation_offset = 0  #animations du menu
@@ -28,7 +54,13 @@ class GameState:
         # Interface
         self.blink_on = True
         
-        # Gameplay
+        # Replays sauvegardés proposés dans le menu (-1 = dernière partie)
+        self.replay_choices = []
+        self.replay_choice_idx = -1
+        self.replay_progress = 0  # % du replay en cours
+        
+        # Gameplay (modèle du monde indépendant du canvas)
+        self.world = World()
         self.reset_gameplay_vars()
         
         # Scores
@@ -52,23 +84,35 @@ class GameState:
             self.replay_recording = []
         self.replay_index = 0
     
+    def watch(self, name: str, callback):
+        "Abonne callback(valeur) aux changements d'un attribut observé"
+        self._watchers.setdefault(name, []).append(callback)
+    
     def reset_gameplay_vars(self):
         "Réinitialise les variables de gameplay"
-        self.last_tick = time.time()
-        self.bird_y = 270
-        self.vy = 0.0
-        
-        self.last_gap_center = None
-        self.pipes = []
-        self.pipe_imgs = []
-        self.last_pipe_spawn = time.time()
-        
+        self.world.reset()
         self.score = 0
-        
-        # Paramètres dynamiques
-        self.pipe_gap = PIPE_GAP_BASE
-        self.pipe_speed = PIPE_SPEED_BASE
-        self.spawn_every_ms = PIPE_SPAWN_EVERY_MS
+
+    # Raccourcis vers le modèle du monde
+    @property
+    def bird_y(self):
+        return self.world.bird_y
+
+    @bird_y.setter
+    def bird_y(self, value):
+        self.world.bird_y = value
+
+    @property
+    def vy(self):
+        return self.world.vy
+
+    @vy.setter
+    def vy(self, value):
+        self.world.vy = value
+
+    @property
+    def pipes(self):
+        return self.world.pipes
 
     def _sync_current_mode_best(self):
         "Met à jour self.best_score depuis le mode sélectionné."
@@ -85,12 +129,24 @@ class GameState:
     
     def set_mode(self, mode_name: str):
         if mode_name in MODES:
-            self.selected_mode = mode_name
             self.selected_idx = MODES.index(mode_name)
+            self.selected_mode = mode_name
             self._sync_current_mode_best()  
             return True
         return False
     
+    def cycle_replay_choice(self, saved_paths):
+        "Sélectionne le replay suivant : dernière partie puis fichiers sauvegardés"
+        self.replay_choices = list(saved_paths)
+        idx = self.replay_choice_idx + 1
+        self.replay_choice_idx = idx if idx < len(self.replay_choices) else -1
+    
+    def selected_replay_path(self):
+        "Chemin du replay sauvegardé choisi (None = dernière partie)"
+        if 0 <= self.replay_choice_idx < len(self.replay_choices):
+            return self.replay_choices[self.replay_choice_idx]
+        return None
+    
     def show_info(self):
         "Affiche l'overlay d'information"
         self.previous_state = self.state_name
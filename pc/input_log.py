@@ -0,0 +1,70 @@
+# input_log.py
+"""
+Replay minimal : graine de la partie + numéros de pas des sauts.
+La simulation étant déterministe, la partie est rejouée en re-simulant le World.
+"""
+
+from array import array
+from world import World
+from constants import WIDTH, HEIGHT, SIM_TICK_MS
+
+
+class InputLog:
+    "Entrées d'une partie (quelques centaines d'octets pour une partie entière)"
+
+    def __init__(self, seed=0, mode="", width=WIDTH, height=HEIGHT, tick_ms=SIM_TICK_MS):
+        self.seed = seed
+        self.mode = mode
+        self.width = width
+        self.height = height
+        self.tick_ms = tick_ms
+        self.flaps = array("I")   # pas avant lesquels l'oiseau saute
+        self.resizes = []         # (pas, largeur, hauteur)
+        self.ticks = 0            # nombre de pas simulés
+        self.final_score = 0
+
+    @classmethod
+    def for_world(cls, world, mode=""):
+        "Journal vide pour une partie qui vient de démarrer"
+        return cls(world.seed, mode, world.width, world.height)
+
+    # ==================== Enregistrement ====================
+
+    def record_flap(self, tick):
+        self.flaps.append(tick)
+
+    def record_resize(self, tick, width, height):
+        self.resizes.append((tick, width, height))
+
+    def record_step(self, world):
+        "Mémorise l'avancement (appelé après chaque pas)"
+        self.ticks = world.tick
+        self.final_score = world.score
+
+    # ==================== Re-simulation ====================
+
+    def simulate(self, store=None):
+        "Rejoue la partie (frames ajoutées à store si fourni), retourne le World final"
+        world = World(self.width, self.height)
+        world.new_game(self.width, self.height, self.seed)
+        flaps, resizes = self.flaps, self.resizes
+        fi = ri = 0
+
+        for tick in range(self.ticks):
+            while ri < len(resizes) and resizes[ri][0] <= tick:
+                world.resize(resizes[ri][1], resizes[ri][2])
+                ri += 1
+            while fi < len(flaps) and flaps[fi] <= tick:
+                world.flap()
+                fi += 1
+
+            world.step(self.tick_ms)
+            if store is not None:
+                store.append(world, world.score)
+            if world.crashed:
+                break
+        return world
+
+    def verify(self, world) -> bool:
+        "Vérifie qu'une re-simulation retrouve le score et la durée enregistrés"
+        return world.score == self.final_score and world.tick == self.ticks
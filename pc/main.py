@@ -5,20 +5,22 @@ Fichier principal de Flappy Bird
 Point d'entrée de l'application
 """
 
-import tkinter as tk
 import time
+import tkinter as tk
 
 from constants import (
-    WIDTH, HEIGHT, FPS_MS, BLINK_MS, 
-    BIRD_SPRITE, BIRD_CRASH_SPRITE, MODES, PIPE_WIDTH
+    WIDTH, HEIGHT, BLINK_MS, PROFILER_HUD_EVERY, PIPE_PREFETCH_MS,
+    BIRD_SPRITE, BIRD_CRASH_SPRITE, MODES
 )
 
 from assets_manager import AssetsManager
 from game_state import GameState
-from physics import PhysicsEngine
 from pipes_manager import PipesManager
 from renderer import Renderer
 from replay_manager import ReplayManager
+from sim_clock import SimClock
+from scheduler import FrameScheduler
+from profiler import FrameProfiler
 
 import serial
 import serial.tools.list_ports
@@ -29,6 +31,7 @@ class FlappyBirdApp(tk.Tk):
     "Application principale Flappy Bird"
     
     def __init__(self):
+        self._t_start = time.perf_counter()
         super().__init__()
         self.title("FLAPIC-BIRD")
         
@@ -38,29 +41,35 @@ class FlappyBirdApp(tk.Tk):
         # Canvas principal
         self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
-        self.canvas.bind("<Configure>", lambda e: self.render_screen())
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
         
         # Initialisation des composants
         self.assets = AssetsManager()
         self.state = GameState()
-        self.physics = PhysicsEngine()
-        self.pipes_manager = PipesManager(self.canvas, self.assets, self.state)
         self.renderer = Renderer(self.canvas, self.assets, self.state)
+        self.pipes_manager = PipesManager(self.canvas, self.assets, self.state, self.renderer)
+        self.clock = SimClock()
+        self.scheduler = FrameScheduler(self, self._frame_state_key)
+        self.profiler = FrameProfiler()
+        self._register_frame_hooks()
         
-        # Initialisation de la série
+        # Série ouverte après le premier affichage (voir _on_first_frame)
         self.serial_port = None
         self.serial_connected = False
-        self._init_serial()
 
-        # Chargement des assets
+        # Chargement des assets en arrière-plan : le menu s'affiche sans attendre
+        self._t_interactive = None
         self._load_all_assets()
+        self.state.watch("selected_mode", self._on_mode_selected)
+        self._prefetch_id = self.after(PIPE_PREFETCH_MS, self._prefetch_neighbours)
         
         # Binding des touches
         self._setup_key_bindings()
         
         # Démarrage des boucles
         self.render_screen()
-        self.after(FPS_MS, self.game_loop)
+        self.after_idle(self._on_first_frame)
+        self.scheduler.start()
         self.after(BLINK_MS, self.blink_loop)
 
         self.replay = ReplayManager()
@@ -84,6 +93,7 @@ class FlappyBirdApp(tk.Tk):
         global saute
         if not self.serial_connected or self.serial_port is None:
             return
+        t0 = time.perf_counter()
         try:
             buffer = ""
             if self.serial_port and self.serial_port.in_waiting > 0:
@@ -153,6 +163,8 @@ class FlappyBirdApp(tk.Tk):
         except Exception as e:
             print(f"Erreur de lecture série: {e}")
         finally:
+            if self.profiler.enabled:
+                self.profiler.add("serial", time.perf_counter() - t0)
             self.after(50, self._read_serial)  # Relance la lecture
 
     def _close_serial(self):
@@ -161,9 +173,17 @@ class FlappyBirdApp(tk.Tk):
             print("Connexion série fermée.")
     
     def destroy(self):
+        self.scheduler.stop()
+        self.assets.textures.shutdown()
         self._close_serial()
         super().destroy()
 
+    def _on_canvas_configure(self, event):
+        "Redimensionnement du canvas : mise à jour du modèle puis rendu"
+        self.state.world.resize(event.width, event.height)
+        self.replay.record_resize(self.state.world)
+        self.render_screen()
+
     def _setup_window(self):
         "Configure la fenêtre principale"
         try:
@@ -173,11 +193,31 @@ class FlappyBirdApp(tk.Tk):
         self.resizable(True, True)
     
     def _load_all_assets(self):
-        "Charge tous les assets du jeu"
-        self.assets.load_bird_sprite(BIRD_SPRITE)
-        self.assets.load_bird_crash_sprite(BIRD_CRASH_SPRITE)
-        self.assets.load_background()
-        self.assets.preload_pipe_textures()
+        "Lance le chargement des assets dans un thread (tuyaux du mode sélectionné en priorité)"
+        self.assets.start_loading(BIRD_SPRITE, BIRD_CRASH_SPRITE, self.state.selected_mode)
+    
+    def _on_mode_selected(self, mode):
+        "Tuyaux du mode chargés tout de suite, voisins préchargés si la sélection reste"
+        self.assets.request_pipes(mode)
+        if self._prefetch_id is not None:
+            self.after_cancel(self._prefetch_id)
+        self._prefetch_id = self.after(PIPE_PREFETCH_MS, self._prefetch_neighbours)
+    
+    def _prefetch_neighbours(self):
+        "Temps libre dans le menu : précharge les modes voisins de la sélection"
+        self._prefetch_id = None
+        if self.state.state_name != "MENU":
+            return
+        i = MODES.index(self.state.selected_mode)
+        self.assets.prefetch_pipes([MODES[(i + 1) % len(MODES)], MODES[i - 1]])
+    
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t_start) * 1000.0
+    
+    def _on_first_frame(self):
+        "Premier écran affiché : mesure du démarrage puis ouverture de la série"
+        print(f"[STARTUP] Premier affichage : {self._elapsed_ms():.0f} ms")
+        self._init_serial()
     
     def _setup_key_bindings(self):
         "Configure tous les bindings clavier"
@@ -193,6 +233,12 @@ class FlappyBirdApp(tk.Tk):
 
         self.bind_all("<Key-r>", lambda e: self.handle_replay())
         self.bind_all("<Key-R>", lambda e: self.handle_replay())
+        self.bind_all("<Key-l>", lambda e: self.cycle_saved_replay())
+        self.bind_all("<Key-L>", lambda e: self.cycle_saved_replay())
+        
+        # HUD de performance
+        self.bind_all("<Key-p>", lambda e: self.toggle_profiler())
+        self.bind_all("<Key-P>", lambda e: self.toggle_profiler())
 
         # Sélection de mode
         self.bind_all("<Key-1>", lambda e: self.set_mode("Button"))
@@ -208,17 +254,23 @@ class FlappyBirdApp(tk.Tk):
         "Affiche/cache l'overlay d'information"
         if self.state.overlay_active:
             self.state.hide_info()
-            # Reset du timer pour éviter un gros dt après la pause
-            self.pipes_manager.timer.start()
             # Effacer les éléments déjà dessinés de l’overlay
             self.canvas.delete("info_overlay")
         else:
             self.state.show_info()
-            self.pipes_manager.timer.pause()
         
         self.render_screen()
 
     
+    def toggle_profiler(self):
+        "Affiche/cache le HUD de performance (mesures actives seulement s'il est affiché)"
+        enabled = self.profiler.toggle()
+        self.state.world.profiler = self.profiler if enabled else None
+        self.scheduler.profiler = self.profiler if enabled else None
+        if not enabled:
+            self.canvas.delete("perf_hud")
+        print(f"[PERF] HUD {'activé' if enabled else 'désactivé'}")
+
     def return_to_menu(self):
         if self.state.overlay_active:
             return
@@ -231,8 +283,8 @@ class FlappyBirdApp(tk.Tk):
         if self.state.overlay_active: 
             return
         if self.state.state_name == "MENU":
-            if self.state.set_mode(mode_name):
-                self.renderer.render_menu()
+            # Le menu se recolore via l'observateur de selected_mode
+            self.state.set_mode(mode_name)
     
     def handle_space(self):
         "Gère l'appui sur espace"
@@ -254,13 +306,20 @@ class FlappyBirdApp(tk.Tk):
     
     def flap(self):
         "Fait sauter l'oiseau"
-        self.state.vy = self.physics.apply_flap()
+        self.replay.record_flap(self.state.world)
+        self.state.world.flap()
 
     def handle_replay(self):
         "Gère le démarrage du replay"
         if self.state.overlay_active:
             return
         
+        # Depuis le menu : replay choisi (fichier sauvegardé ou dernière partie)
+        if self.state.state_name == "MENU":
+            path = self.state.selected_replay_path()
+            if path is None or not self.replay.load_file(path):
+                self.replay.use_last_game()
+        
         # Depuis le menu ou game over
         if self.state.state_name in ("MENU", "GAME_OVER"):
             if self.replay.has_replay():
@@ -268,6 +327,13 @@ class FlappyBirdApp(tk.Tk):
             else:
                 print("[REPLAY] Aucun replay disponible")
 
+    def cycle_saved_replay(self):
+        "Passe au replay sauvegardé suivant (menu)"
+        if self.state.overlay_active or self.state.state_name != "MENU":
+            return
+        self.state.cycle_replay_choice(self.replay.list_saved())
+        self.renderer.render_menu()
+
     def start_replay_playback(self):
         "Démarre la lecture du replay"
         if self.replay.start_playback():
@@ -277,20 +343,20 @@ class FlappyBirdApp(tk.Tk):
 
     def reset_replay_display(self):
         "Prépare l'affichage pour le replay"
-        self.canvas.delete("all")
+        self.renderer.clear_canvas()
         h = self.canvas.winfo_height() or HEIGHT
         self.state.bird_y = h // 2
         self.state.vy = 0
         self.state.score = 0
-        self.state.pipes = []
-        self.state.pipe_imgs = []
+        self.state.replay_progress = 0
+        self.state.world.pipes.clear()
         
-        # Réinitialiser le timer
-        self.state.last_tick = time.time()
+        # Pool de tuyaux avec les textures du mode du replay
+        self.pipes_manager.reset(self.replay.mode)
+        self.pipes_manager.build_pool()
         
-        # Réinitialiser les images de replay
-        if hasattr(self, '_replay_pipe_imgs'):
-            self._replay_pipe_imgs.clear()
+        # Réinitialiser l'horloge de simulation
+        self.clock.reset()
 
 
     # ==================== Gestion des états ====================
@@ -304,11 +370,17 @@ class FlappyBirdApp(tk.Tk):
         if old_state == "REPLAY":
             self.replay.stop_playback()
             self.renderer.clear_playfield()
+            self.pipes_manager.reset()
         
         # Nettoyage en quittant PLAYING
         if old_state == "PLAYING" and new_state in ("GAME_OVER", "MENU"):
             self.replay.stop_recording()
             self.renderer.clear_playfield()
+            self.pipes_manager.reset()
+            
+            # Sauvegarde sur disque à chaque game over
+            if new_state == "GAME_OVER":
+                self.replay.save(self.state.score)
         
         # Réinitialiser l'animation du menu
         if new_state == "MENU":
@@ -327,7 +399,7 @@ class FlappyBirdApp(tk.Tk):
         # Initialisation en entrant dans PLAYING
         if new_state == "PLAYING":
             self.reset_gameplay()
-            self.replay.start_recording()
+            self.replay.start_recording(self.state.selected_mode, self.state.world)
             if self.state.selected_mode == "Quit":
                 self.destroy()
             elif self.state.selected_mode == "Button":
@@ -347,7 +419,6 @@ class FlappyBirdApp(tk.Tk):
                 if self.serial_connected and self.serial_port:
                     self.serial_port.write(command.encode("utf-8"))
 
-        self.after(FPS_MS, self.game_loop)
         self.render_screen()
 
 
@@ -357,11 +428,14 @@ class FlappyBirdApp(tk.Tk):
         self.state.reset_gameplay_vars()
         
         # Nettoyage du canvas
-        self.canvas.delete("all")
+        self.renderer.clear_canvas()
+        self.pipes_manager.reset()
+        self.pipes_manager.build_pool()
         
-        # Position initiale de l'oiseau
+        # Nouvelle partie (graine propre, oiseau au centre, premier tuyau)
+        w = self.canvas.winfo_width() or WIDTH
         h = self.canvas.winfo_height() or HEIGHT
-        self.state.bird_y = h // 2
+        self.state.world.new_game(w, h)
         
         # Focus pour que les touches fonctionnent
         try:
@@ -369,51 +443,29 @@ class FlappyBirdApp(tk.Tk):
         except Exception:
             pass
         
-        # Spawn du premier tuyau
-        self.pipes_manager.spawn_pipe_pair(initial=True)
-        self.pipes_manager.mark_pipe_spawn()
+        self.pipes_manager.sync()
+        
+        # Horloge de simulation à pas fixe
+        self.clock.reset()
     
     # ==================== Update gameplay ====================
     def update_button_mode(self, dt):
-        "Met à jour la physique en mode Button"
-        # Gravité
-        self.state.vy = self.physics.apply_gravity(self.state.vy)
-        self.state.bird_y += self.state.vy
-        
-        # Collision avec les bords
-        h = self.canvas.winfo_height() or HEIGHT
-        if self.physics.check_bounds_collision(self.state.bird_y, h):
-            self.change_state("GAME_OVER")
-            return False
-        
-        # Spawn de tuyaux
-        if self.pipes_manager.should_spawn_new_pipe():
-            self.pipes_manager.spawn_pipe_pair()
-            self.pipes_manager.mark_pipe_spawn()
+        "Avance la physique d'un pas fixe de dt secondes"
+        world = self.state.world
         
-        # Déplacement des tuyaux
-        score_add = self.pipes_manager.move_pipes()
+        # Pas de simulation (gravité, tuyaux, collisions) sans le canvas
+        score_add = world.step(dt * 1000.0)
         if score_add:
+            self.state.increment_score()
             command = "s"
             if self.serial_connected and self.serial_port:
-                self.serial_port.write(command.encode("utf-8"))
-
-
+                self.profiler.timed("serial", self.serial_port.write, command.encode("utf-8"))
 
         # Enregistrer la frame avec les coordonnées des tuyaux
         if self.replay.is_recording:
-            self.replay.record_frame(
-                self.state.bird_y,
-                self.state.vy,
-                self.state.pipes,
-                self.state.score,
-                self.canvas
-            )
-        
-        # Collision avec les tuyaux
-        if self.physics.check_pipe_collision(
-            self.state.bird_y, self.state.pipes, self.canvas
-        ):
+            self.profiler.timed("record", self.replay.record_frame, world, self.state.score)
+        
+        if world.crashed:
             self.change_state("GAME_OVER")
             return False
         
@@ -427,80 +479,20 @@ class FlappyBirdApp(tk.Tk):
             return False
         
         # Récupérer la prochaine frame
-        frame = self.replay.get_next_frame()
+        world = self.state.world
+        frame = self.replay.get_next_frame(world.width, world.height)
         if frame is None:
             self.change_state("GAME_OVER")
             return False
         
-        # Appliquer l'état de la frame
-        self.state.bird_y = frame['bird_y']
-        self.state.vy = frame['vy']
-        self.state.score = frame['score']
-        
-        # Redessiner les tuyaux à partir des données enregistrées
-        self._draw_replay_pipes(frame['pipes'])
+        # Appliquer l'état de la frame (tuyaux affichés au rendu par le pool)
+        self.state.bird_y, self.state.vy, self.state.score, pipes = frame
+        world.pipes.clear()
+        world.pipes.extend(pipes)
+        self.state.replay_progress = int(self.replay.get_progress())
         
         return True
 
-    def _draw_replay_pipes(self, pipes_data):
-        "Dessine les tuyaux pendant le replay"
-        # Nettoyer les anciens tuyaux
-        self.canvas.delete("replay_pipe")
-        self.canvas.delete("replay_pipe_img")
-        
-        w = self.canvas.winfo_width() or WIDTH
-        h = self.canvas.winfo_height() or HEIGHT
-        
-        # Récupérer les textures
-        pil_top, pil_bot = self.assets.get_pipe_textures(self.state.selected_mode)
-        
-        for pipe_info in pipes_data:
-            # Récupérer les coordonnées depuis le pipe_info
-            x = pipe_info.get('x', 0)
-            top_h = pipe_info.get('top_h', 0)
-            bot_y = pipe_info.get('bot_y', 0)
-            pipe_width = pipe_info.get('width', PIPE_WIDTH)
-            
-            # Dessiner les rectangles
-            self.canvas.create_rectangle(
-                x, 0, x + pipe_width, top_h,
-                fill="black",
-                tags=("replay_pipe",)
-            )
-            self.canvas.create_rectangle(
-                x, bot_y, x + pipe_width, h,
-                fill="black",
-                tags=("replay_pipe",)
-            )
-            
-            # Dessiner les textures
-            if pil_top:
-                from PIL import ImageTk
-                top_tk = ImageTk.PhotoImage(pil_top)
-                self.canvas.create_image(
-                    x, top_h, image=top_tk, anchor="sw",
-                    tags=("replay_pipe_img",)
-                )
-                # Garder une référence pour éviter le garbage collection
-                if not hasattr(self, '_replay_pipe_imgs'):
-                    self._replay_pipe_imgs = []
-                self._replay_pipe_imgs.append(top_tk)
-            
-            if pil_bot:
-                from PIL import ImageTk
-                bot_tk = ImageTk.PhotoImage(pil_bot)
-                self.canvas.create_image(
-                    x, bot_y, image=bot_tk, anchor="nw",
-                    tags=("replay_pipe_img",)
-                )
-                if not hasattr(self, '_replay_pipe_imgs'):
-                    self._replay_pipe_imgs = []
-                self._replay_pipe_imgs.append(bot_tk)
-        
-        # Mettre l'oiseau au-dessus
-        self.canvas.tag_raise("bird_img")
-        self.canvas.tag_raise("hud")
-            
     # ==================== Rendu ====================
     def render_screen(self):
         "Affiche l'écran en fonction de l'état"
@@ -508,113 +500,104 @@ class FlappyBirdApp(tk.Tk):
         h = self.canvas.winfo_height() or HEIGHT
         
         if self.state.state_name == "MENU":
-            self.canvas.delete("all")  # Nettoyer TOUT
+            self.renderer.clear_canvas()  # Nettoyer TOUT
             self.renderer.draw_menu_background()
             self.renderer.draw_title(w, h)
             self.renderer.render_menu()
             self.renderer.draw_footer(w, h)
         
         elif self.state.state_name == "PLAYING":
-            # Ne pas effacer "all" pendant le jeu, juste le HUD
-            self.canvas.delete("hud")
+            # Ne pas effacer "all" pendant le jeu : le HUD est juste replacé
             self.renderer.draw_play_background()
             self.renderer.draw_bird()
-            self.renderer.update_score_hud()
+            self.renderer.layout_hud()
             
         elif self.state.state_name == "REPLAY":
-            self.canvas.delete("hud")
             self.renderer.draw_play_background()
             self.renderer.draw_bird()
-            self.renderer.update_replay_hud()
+            self.renderer.layout_hud(replay=True)
         
         elif self.state.state_name == "GAME_OVER":
-            self.canvas.delete("all")  # Nettoyer TOUT
+            self.renderer.clear_canvas()  # Nettoyer TOUT
             self.renderer.render_game_over()
         
         # Overlay par-dessus si actif
         if self.state.overlay_active and self.state.overlay_type == "INFO":
+            self.canvas.delete("info_overlay")
             self.renderer.render_info_overlay()
         else:
             self.canvas.delete("info_overlay")
                 
     # ==================== Boucles ====================
     
-    def game_loop(self):
-        "Boucle principale du jeu"
-        now = time.time()
-        dt = now - self.state.last_tick
-        self.state.last_tick = now
-
-        # Si overlay actif, on freeze la logique de jeu
+    def _frame_state_key(self):
+        "État utilisé par l'ordonnanceur (INFO = overlay, jeu figé)"
         if self.state.overlay_active:
-            self.after(FPS_MS, self.game_loop)
+            return "INFO"
+        return self.state.state_name
+
+    def _register_frame_hooks(self):
+        "Branche les updates/rendus de chaque état sur l'unique boucle de frames"
+        sch = self.scheduler
+        # Overlay : on freeze la logique de jeu
+        sch.register("INFO", update=self.clock.reset)
+        sch.register("MENU", render=self.renderer.animate_title)
+        sch.register("REPLAY", update=self.update_replay_frame, render=self.render_replay_frame)
+        sch.register("PLAYING", update=self.update_playing_frame, render=self.render_playing_frame)
+        for state in ("MENU", "GAME_OVER", "REPLAY", "PLAYING"):
+            sch.register(state, render=self.render_perf_hud)
+        for state in ("INFO", "MENU", "GAME_OVER", "REPLAY", "PLAYING"):
+            sch.register(state, update=self.poll_assets)
+
+    def poll_assets(self):
+        "Assets chargés ou textures redimensionnées en arrière-plan : on remplace les remplaçants"
+        loaded = self.assets.poll_loading()
+        if self.assets.poll_textures() or loaded:
+            self.render_screen()
+        if not loaded:
             return
         
-        # Animation continue du menu
-        if self.state.state_name == "MENU":
-            self.state.menu_animation_offset += 1
-            if self.state.menu_animation_offset % 5 == 0:
-                self.render_screen()
-        
-        # Animation continue du game over
-        elif self.state.state_name == "GAME_OVER":
-            self.state.menu_animation_offset += 1
-            if self.state.menu_animation_offset % 3 == 0:
-                self.render_screen()
-        
-        # Gestion du mode REPLAY
-        elif self.state.state_name == "REPLAY":
-            # Avancer 2x plus vite
-            for _ in range(2):
-                if not self.update_replay_mode(dt):
-                    self.after(FPS_MS, self.game_loop)
-                    return
-            
-            # Rendu
-            self.renderer.draw_play_background()
-            self.renderer.draw_bird()
-            self.renderer.update_replay_hud()
-            self.after(FPS_MS, self.game_loop)
-        
-        elif self.state.state_name == "PLAYING":        
-            if self.state.selected_mode == "Button":
-                # Mise à jour de la physique
-                if not self.update_button_mode(dt):
-                    self.after(FPS_MS, self.game_loop)
-                    return
-                
-                # Rendu
-                self.renderer.draw_play_background()
-                self.renderer.update_score_hud()
-                self.renderer.draw_bird()
+        if self._t_interactive is None and self.assets.is_ready(self.state.selected_mode):
+            self._t_interactive = self._elapsed_ms()
+            print(f"[STARTUP] Interactif (oiseau + tuyaux {self.state.selected_mode}) : "
+                  f"{self._t_interactive:.0f} ms")
 
-            elif self.state.selected_mode == "Infrared":
-                if not self.update_button_mode(dt):
-                    self.after(FPS_MS, self.game_loop)
-                    return
-                
-                self.renderer.draw_play_background()
-                self.renderer.update_score_hud()
-                self.renderer.draw_bird()
+    def render_perf_hud(self):
+        "HUD de performance, rafraîchi toutes les PROFILER_HUD_EVERY frames"
+        if not self.profiler.enabled or self.scheduler.frame_count % PROFILER_HUD_EVERY:
+            return
+        self.renderer.update_perf_hud(
+            self.profiler, self.scheduler, len(self.canvas.find_all())
+        )
+
+    def update_replay_frame(self):
+        "Une frame enregistrée par pas de simulation, x2 plus vite"
+        steps = self.clock.advance() * int(self.replay.replay_speed)
+        dt = self.clock.tick_ms / 1000.0
+        for _ in range(steps):
+            if not self.update_replay_mode(dt):
+                return False
+        return True
 
-            elif self.state.selected_mode == "Digit_Encoder":
-                if not self.update_button_mode(dt):
-                    self.after(FPS_MS, self.game_loop)
-                    return
-                
-                self.renderer.draw_play_background()
-                self.renderer.update_score_hud()
-                self.renderer.draw_bird()
-
-            elif self.state.selected_mode == "Ultrasound": 
-                if not self.update_button_mode(dt):
-                    self.after(FPS_MS, self.game_loop)
-                    return
-                
-                self.renderer.draw_play_background()
-                self.renderer.update_score_hud()
-                self.renderer.draw_bird()  
-            self.after(FPS_MS, self.game_loop)
+    def render_replay_frame(self):
+        "Rendu du replay (le fond est statique, refait seulement au redimensionnement)"
+        self.pipes_manager.sync()
+        self.renderer.draw_bird()
+
+    def update_playing_frame(self):
+        "Simulation à pas fixe : autant de pas que le temps réel écoulé"
+        steps = self.clock.advance()
+        dt = self.clock.tick_ms / 1000.0
+        for _ in range(steps):
+            if not self.update_button_mode(dt):
+                return False
+        return True
+
+    def render_playing_frame(self):
+        "Rendu interpolé entre les deux derniers états"
+        alpha = self.clock.alpha
+        self.pipes_manager.sync(alpha)
+        self.renderer.draw_bird(alpha)
 
     def blink_loop(self):
         "Boucle de clignotement du texte du menu "
@@ -624,6 +607,10 @@ class FlappyBirdApp(tk.Tk):
         if self.state.state_name == "MENU":
             blink_targets.append("press_start")
         
+        # Clignotement du "Press to return to menu" dans le GAME_OVER
+        elif self.state.state_name == "GAME_OVER":
+            blink_targets.append("instructions")
+        
         # Clignotement du "Press I to close" dans l'overlay INFO
         if self.state.overlay_active and self.state.overlay_type == "INFO":
             blink_targets.append("info_close")
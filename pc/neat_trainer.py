@@ -0,0 +1,389 @@
+# neat_trainer.py
+"""
+Entraînement NEAT (neuroévolution) sur la vraie physique du jeu, sans affichage.
+Les génomes sont évalués en parallèle (pool de processus) avec BatchSimulator.
+"""
+
+import math
+import os
+import random
+import time
+from multiprocessing import Pool
+
+import numpy as np
+from batch_sim import BatchSimulator
+from constants import BIRD_X, MAX_VY
+
+
+# -- Paramètres NEAT --
+N_INPUTS = 5              # y, vy, distance au tuyau, marges haut/bas du trou
+N_OUTPUTS = 1             # > 0.5 = saut
+POPULATION_SIZE = 150
+COMPAT_THRESHOLD = 3.0
+COMPAT_DISJOINT = 1.0
+COMPAT_WEIGHT = 0.4
+ELITISM = 1               # meilleurs génomes copiés tels quels par espèce
+SURVIVAL_RATE = 0.2       # part de chaque espèce autorisée à se reproduire
+STAGNATION_LIMIT = 15     # générations sans progrès avant extinction d'une espèce
+
+PROB_MUTATE_WEIGHT = 0.8
+PROB_REPLACE_WEIGHT = 0.1
+WEIGHT_PERTURB = 0.5
+PROB_ADD_CONN = 0.08
+PROB_ADD_NODE = 0.03
+PROB_TOGGLE_CONN = 0.01
+PROB_CROSSOVER = 0.75
+
+# -- Paramètres d'évaluation --
+TARGET_SCORE = 30         # score visé (tuyaux franchis)
+GEN_TIME_BUDGET_S = 20.0  # budget de temps par génération
+
+
+class ConnGene:
+    "Connexion entre deux neurones"
+    __slots__ = ("src", "dst", "weight", "enabled", "innovation")
+
+    def __init__(self, src, dst, weight, innovation, enabled=True):
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.enabled = enabled
+        self.innovation = innovation
+
+    def copy(self):
+        return ConnGene(self.src, self.dst, self.weight, self.innovation, self.enabled)
+
+
+class InnovationTracker:
+    "Attribue le même numéro d'innovation aux mêmes mutations structurelles"
+
+    def __init__(self):
+        self.next_node = N_INPUTS + N_OUTPUTS
+        self._conn = {}
+        self._split = {}
+
+    def conn_innovation(self, src, dst):
+        key = (src, dst)
+        if key not in self._conn:
+            self._conn[key] = len(self._conn)
+        return self._conn[key]
+
+    def split_node(self, innovation):
+        "Neurone créé en coupant la connexion 'innovation'"
+        if innovation not in self._split:
+            self._split[innovation] = self.next_node
+            self.next_node += 1
+        return self._split[innovation]
+
+
+class Genome:
+    "Génome NEAT : biais des neurones + gènes de connexion"
+
+    def __init__(self, key):
+        self.key = key
+        self.biases = {}   # id neurone (hors entrées) -> biais
+        self.conns = {}    # innovation -> ConnGene
+        self.fitness = 0.0
+        self.score = 0
+
+    @classmethod
+    def initial(cls, key, tracker, rng):
+        "Réseau minimal : toutes les entrées reliées à la sortie"
+        g = cls(key)
+        for o in range(N_INPUTS, N_INPUTS + N_OUTPUTS):
+            g.biases[o] = rng.gauss(0.0, 1.0)
+            for i in range(N_INPUTS):
+                inno = tracker.conn_innovation(i, o)
+                g.conns[inno] = ConnGene(i, o, rng.gauss(0.0, 1.0), inno)
+        return g
+
+    def copy(self, key):
+        g = Genome(key)
+        g.biases = dict(self.biases)
+        g.conns = {k: c.copy() for k, c in self.conns.items()}
+        return g
+
+    # ==================== Mutations ====================
+
+    def mutate(self, tracker, rng):
+        if rng.random() < PROB_MUTATE_WEIGHT:
+            for c in self.conns.values():
+                if rng.random() < PROB_REPLACE_WEIGHT:
+                    c.weight = rng.gauss(0.0, 1.0)
+                else:
+                    c.weight += rng.gauss(0.0, WEIGHT_PERTURB)
+            for n in self.biases:
+                self.biases[n] += rng.gauss(0.0, WEIGHT_PERTURB * 0.5)
+        if rng.random() < PROB_ADD_CONN:
+            self._mutate_add_conn(tracker, rng)
+        if rng.random() < PROB_ADD_NODE:
+            self._mutate_add_node(tracker, rng)
+        if self.conns and rng.random() < PROB_TOGGLE_CONN:
+            c = rng.choice(list(self.conns.values()))
+            c.enabled = not c.enabled
+
+    def _creates_cycle(self, src, dst):
+        "Vrai si la connexion src -> dst fermerait une boucle"
+        if src == dst:
+            return True
+        seen = {dst}
+        stack = [dst]
+        while stack:
+            node = stack.pop()
+            for c in self.conns.values():
+                if c.src == node and c.dst not in seen:
+                    if c.dst == src:
+                        return True
+                    seen.add(c.dst)
+                    stack.append(c.dst)
+        return False
+
+    def _mutate_add_conn(self, tracker, rng):
+        sources = list(range(N_INPUTS)) + [n for n in self.biases if n >= N_INPUTS + N_OUTPUTS]
+        targets = list(self.biases)
+        src = rng.choice(sources)
+        dst = rng.choice(targets)
+        if any(c.src == src and c.dst == dst for c in self.conns.values()):
+            return
+        if self._creates_cycle(src, dst):
+            return
+        inno = tracker.conn_innovation(src, dst)
+        self.conns[inno] = ConnGene(src, dst, rng.gauss(0.0, 1.0), inno)
+
+    def _mutate_add_node(self, tracker, rng):
+        enabled = [c for c in self.conns.values() if c.enabled]
+        if not enabled:
+            return
+        old = rng.choice(enabled)
+        node = tracker.split_node(old.innovation)
+        if node in self.biases:
+            return
+        old.enabled = False
+        self.biases[node] = 0.0
+        i1 = tracker.conn_innovation(old.src, node)
+        i2 = tracker.conn_innovation(node, old.dst)
+        self.conns[i1] = ConnGene(old.src, node, 1.0, i1)
+        self.conns[i2] = ConnGene(node, old.dst, old.weight, i2)
+
+    # ==================== Reproduction ====================
+
+    @staticmethod
+    def crossover(key, fit, other, rng):
+        "Enfant : gènes communs tirés au hasard, gènes propres du parent le plus fort"
+        child = Genome(key)
+        for inno, c in fit.conns.items():
+            o = other.conns.get(inno)
+            gene = (o if o is not None and rng.random() < 0.5 else c).copy()
+            if o is not None and not (c.enabled and o.enabled) and rng.random() < 0.75:
+                gene.enabled = False
+            child.conns[inno] = gene
+        for n, b in fit.biases.items():
+            ob = other.biases.get(n)
+            child.biases[n] = ob if ob is not None and rng.random() < 0.5 else b
+        return child
+
+    def distance(self, other) -> float:
+        "Distance de compatibilité (gènes disjoints + écart moyen des poids)"
+        common = self.conns.keys() & other.conns.keys()
+        disjoint = len(self.conns) + len(other.conns) - 2 * len(common)
+        n = max(len(self.conns), len(other.conns), 1)
+        w = 0.0
+        if common:
+            w = sum(abs(self.conns[k].weight - other.conns[k].weight) for k in common) / len(common)
+        return COMPAT_DISJOINT * disjoint / n + COMPAT_WEIGHT * w
+
+
+class FeedForwardNet:
+    "Réseau compilé à partir d'un génome (ordre topologique)"
+
+    def __init__(self, genome):
+        links = {}
+        for c in genome.conns.values():
+            if c.enabled:
+                links.setdefault(c.dst, []).append((c.src, c.weight))
+
+        # Ordre d'évaluation : un neurone après toutes ses sources
+        order = []
+        done = set(range(N_INPUTS))
+        pending = [n for n in genome.biases]
+        while pending:
+            ready = [n for n in pending if all(s in done for s, _ in links.get(n, ()))]
+            if not ready:
+                break
+            for n in ready:
+                order.append((n, genome.biases[n], links.get(n, ())))
+                done.add(n)
+            pending = [n for n in pending if n not in done]
+        self.order = order
+
+    def activate(self, inputs):
+        values = dict(enumerate(inputs))
+        for node, bias, srcs in self.order:
+            x = bias
+            for s, w in srcs:
+                x += values.get(s, 0.0) * w
+            x = max(-60.0, min(60.0, 4.9 * x))
+            values[node] = 1.0 / (1.0 + math.exp(-x))
+        return values.get(N_INPUTS, 0.0)
+
+
+def evaluate_genomes(args):
+    "Évalue une liste de génomes sur un même parcours (exécuté dans un processus)"
+    genomes, seed, gap, max_score, deadline = args
+    # Même parcours (même graine) pour tous les morceaux de la génération
+    nets = [FeedForwardNet(g) for g in genomes]
+    sim = BatchSimulator(len(genomes), gap=gap, seed=seed)
+    h = float(sim.course.height)
+    w = float(sim.course.width)
+    flaps = np.zeros(len(genomes), dtype=bool)
+
+    while sim.n_alive and sim.course.score < max_score:
+        if time.time() > deadline:
+            break
+        pipe = sim.next_pipe()
+        if pipe is None:
+            dx, top, bot = 1.0, 0.0, 1.0
+        else:
+            dx = (pipe.x - BIRD_X) / w
+            top = pipe.top_h / h
+            bot = pipe.bot_y / h
+
+        flaps[:] = False
+        for i in np.flatnonzero(sim.alive):
+            y = sim.bird_y[i] / h
+            out = nets[i].activate((y, sim.vy[i] / MAX_VY, dx, y - top, bot - y))
+            flaps[i] = out > 0.5
+        sim.step(flaps)
+
+    return [(int(t), int(s)) for t, s in zip(sim.ticks_alive, sim.score)]
+
+
+class Population:
+    "Population NEAT avec spéciation"
+
+    def __init__(self, size=POPULATION_SIZE, seed=None):
+        self.rng_seed = seed
+        self.rng = random.Random(seed)  # propre à la population (mutations, croisements, sélection)
+        self.size = size
+        self.tracker = InnovationTracker()
+        self._next_key = 0
+        self.genomes = [Genome.initial(self._new_key(), self.tracker, self.rng) for _ in range(size)]
+        self.species = []  # [représentant, membres, meilleure fitness, générations sans progrès]
+        self.generation = 0
+
+    def _new_key(self):
+        self._next_key += 1
+        return self._next_key
+
+    def speciate(self):
+        "Répartit les génomes en espèces selon la distance de compatibilité"
+        for sp in self.species:
+            sp[1] = []
+        for g in self.genomes:
+            for sp in self.species:
+                if g.distance(sp[0]) < COMPAT_THRESHOLD:
+                    sp[1].append(g)
+                    break
+            else:
+                self.species.append([g, [g], -1.0, 0])
+        self.species = [sp for sp in self.species if sp[1]]
+
+    def evaluate(self, pool, gap, max_score=TARGET_SCORE, budget_s=GEN_TIME_BUDGET_S, workers=1):
+        "Évalue toute la population en parallèle dans le budget de temps"
+        seed = self.rng.randrange(1 << 30)
+        deadline = time.time() + budget_s
+        chunk = max(1, math.ceil(len(self.genomes) / (workers * 2)))
+        chunks = [self.genomes[i:i + chunk] for i in range(0, len(self.genomes), chunk)]
+        jobs = [(c, seed, gap, max_score, deadline) for c in chunks]
+
+        results = pool.map(evaluate_genomes, jobs) if pool else list(map(evaluate_genomes, jobs))
+        for c, res in zip(chunks, results):
+            for g, (ticks, score) in zip(c, res):
+                g.score = score
+                g.fitness = ticks + 100.0 * score
+
+    def reproduce(self):
+        "Nouvelle génération : élitisme + croisements dans chaque espèce"
+        self.speciate()
+
+        # Extinction des espèces qui stagnent (on garde toujours la meilleure)
+        best_sp = max(self.species, key=lambda sp: max(g.fitness for g in sp[1]))
+        kept = []
+        for sp in self.species:
+            top = max(g.fitness for g in sp[1])
+            if top > sp[2]:
+                sp[2], sp[3] = top, 0
+            else:
+                sp[3] += 1
+            if sp[3] < STAGNATION_LIMIT or sp is best_sp:
+                kept.append(sp)
+        self.species = kept
+
+        rng = self.rng
+
+        # Fitness partagée -> nombre d'enfants par espèce
+        adjusted = [sum(g.fitness for g in sp[1]) / len(sp[1]) for sp in self.species]
+        total = sum(adjusted) or 1.0
+        quotas = [max(ELITISM, int(round(self.size * a / total))) for a in adjusted]
+
+        new = []
+        for sp, quota in zip(self.species, quotas):
+            members = sorted(sp[1], key=lambda g: g.fitness, reverse=True)
+            for g in members[:ELITISM]:
+                new.append(g.copy(self._new_key()))
+            parents = members[:max(1, int(math.ceil(len(members) * SURVIVAL_RATE)))]
+            for _ in range(quota - ELITISM):
+                a = rng.choice(parents)
+                if len(parents) > 1 and rng.random() < PROB_CROSSOVER:
+                    b = rng.choice(parents)
+                    if b.fitness > a.fitness:
+                        a, b = b, a
+                    child = Genome.crossover(self._new_key(), a, b, rng)
+                else:
+                    child = a.copy(self._new_key())
+                child.mutate(self.tracker, rng)
+                new.append(child)
+            # Nouveau représentant de l'espèce
+            sp[0] = rng.choice(members)
+
+        self.genomes = new[:self.size]
+        while len(self.genomes) < self.size:
+            child = rng.choice(new).copy(self._new_key())
+            child.mutate(self.tracker, rng)
+            self.genomes.append(child)
+        self.generation += 1
+
+
+def train(gap, generations=100, pop_size=POPULATION_SIZE, target=TARGET_SCORE,
+          budget_s=GEN_TIME_BUDGET_S, workers=None, seed=None, verbose=True):
+    """
+    Entraîne une population pour un gap donné.
+    Retourne (historique [(génération, score max, score moyen)], générations pour
+    atteindre 'target' ou None).
+    """
+    workers = workers or os.cpu_count() or 1
+    pop = Population(pop_size, seed)
+    history = []
+    reached = None
+
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        for gen in range(generations):
+            t0 = time.perf_counter()
+            pop.evaluate(pool, gap, max_score=target, budget_s=budget_s, workers=workers)
+            scores = [g.score for g in pop.genomes]
+            best, mean = max(scores), sum(scores) / len(scores)
+            history.append((gen, best, mean))
+            if verbose:
+                print(f"[NEAT] gap={gap} gen={gen} best={best} mean={mean:.2f} "
+                      f"({time.perf_counter() - t0:.2f} s)")
+            if best >= target:
+                reached = gen
+                break
+            pop.reproduce()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    return history, reached
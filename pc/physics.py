@@ -51,19 +51,26 @@ class PhysicsEngine:
         return (dx * dx + dy * dy) <= r2
     
     @staticmethod
-    def check_pipe_collision(bird_y: float, pipes, canvas) -> bool:
-        "Vérifie si l'oiseau entre en collision avec un tuyau"
+    def check_pipe_collision(bird_y: float, pipes, height: int) -> bool:
+        "Vérifie si l'oiseau entre en collision avec un tuyau (tuyaux triés par x)"
         cx = BIRD_X
         cy = int(bird_y)
         r = BIRD_RADIUS
         r2 = r * r
         
-        for (top, bot, _) in pipes:
-            tx1, ty1, tx2, ty2 = canvas.coords(top)
-            bx1, by1, bx2, by2 = canvas.coords(bot)
+        for pipe in pipes:
+            x1 = pipe.x
+            x2 = pipe.x + pipe.width
             
-            if PhysicsEngine.circle_rect_collision(cx, cy, r2, tx1, ty1, tx2, ty2) or \
-               PhysicsEngine.circle_rect_collision(cx, cy, r2, bx1, by1, bx2, by2):
+            # Phase large : seuls les tuyaux qui recouvrent [cx - r, cx + r] comptent
+            if x1 > cx + r:
+                break  # ce tuyau et tous les suivants sont à droite de l'oiseau
+            if x2 < cx - r:
+                continue  # déjà dépassé
+            
+            # Phase fine
+            if PhysicsEngine.circle_rect_collision(cx, cy, r2, x1, 0, x2, pipe.top_h) or \
+               PhysicsEngine.circle_rect_collision(cx, cy, r2, x1, pipe.bot_y, x2, height):
                 return True
         
         return False
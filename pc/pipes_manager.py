@@ -1,165 +1,154 @@
 # pipes_manager.py
 """
-Gestion des tuyaux (spawn, déplacement, suppression)
+Affichage des tuyaux : reflète sur le canvas les tuyaux du modèle World
 """
 
-import random
-from my_timer import Timer
-from PIL import ImageTk
-from constants import (
-    WIDTH, HEIGHT, PIPE_WIDTH, PIPE_GAP_MIN,
-    PIPE_GAP_JITTER, PIPE_CENTER_MIN_FRAC, PIPE_CENTER_MAX_FRAC,
-    PIPE_CENTER_DELTA_MINF, PIPE_SPEED_MAX, BIRD_X
-)
+from constants import PIPE_POOL_SIZE
+
+
+class PipeSlot:
+    "Emplacement réutilisable : rectangles + sprites d'une paire de tuyaux"
+    __slots__ = ("top_rect", "bot_rect", "top_img", "bot_img", "photos")
+
+    def __init__(self, top_rect, bot_rect, top_img, bot_img, photos):
+        self.top_rect = top_rect
+        self.bot_rect = bot_rect
+        self.top_img = top_img
+        self.bot_img = bot_img
+        self.photos = photos  # (PhotoImage haut, PhotoImage bas) affichées
+
+    def items(self):
+        return [i for i in (self.top_rect, self.bot_rect, self.top_img, self.bot_img) if i]
 
 
 class PipesManager:
-    "Classe gérant les tuyaux"
-    
-    def __init__(self, canvas, assets_manager, game_state):
+    "Classe gérant l'affichage des tuyaux (pool d'items canvas recyclés)"
+
+    def __init__(self, canvas, assets_manager, game_state, layers):
         self.canvas = canvas
         self.assets = assets_manager
         self.state = game_state
-        self.timer = Timer()
-        self.timer.start()
-    
-    def calculate_dynamic_gap(self) -> int:
-        "Calcule le gap dynamique en fonction du score"
-        base = max(PIPE_GAP_MIN, self.state.pipe_gap - self.state.score * 2)
-        jitter = random.randint(-PIPE_GAP_JITTER, PIPE_GAP_JITTER)
-        return max(PIPE_GAP_MIN, base + jitter)
-    
-    def spawn_pipe_pair(self, initial=False):
-        "Crée une paire de tuyaux"
-        w = self.canvas.winfo_width() or WIDTH
-        h = self.canvas.winfo_height() or HEIGHT
-        
-        # Calcul du gap et du centre
-        gap = self.calculate_dynamic_gap()
-        
-        min_c = int(h * PIPE_CENTER_MIN_FRAC)
-        max_c = int(h * PIPE_CENTER_MAX_FRAC)
-        min_delta = int(h * PIPE_CENTER_DELTA_MINF)
-        
-        if self.state.last_gap_center is None:
-            gap_center = random.randint(min_c, max_c)
-        else:
-            if random.random() < 0.5:
-                gap_center = random.randint(
-                    min_c, max(self.state.last_gap_center - min_delta, min_c)
-                )
-            else:
-                gap_center = random.randint(
-                    min(self.state.last_gap_center + min_delta, max_c), max_c
-                )
-            
-            if abs(gap_center - self.state.last_gap_center) < min_delta:
-                for _ in range(8):
-                    candidate = random.randint(min_c, max_c)
-                    if abs(candidate - self.state.last_gap_center) >= min_delta:
-                        gap_center = candidate
-                        break
-        
-        self.state.last_gap_center = gap_center
-        
-        top_h = max(40, gap_center - gap // 2)
-        bot_y = gap_center + gap // 2
-        
-        # Position X
-        x = (w + PIPE_WIDTH) if not initial else (w + 30)
-        
-        # Création des rectangles (hitboxes)
+        self.layers = layers  # Renderer : insertion dans la couche "pipes"
+        self._free = []       # emplacements cachés disponibles
+        self._active = {}     # id du tuyau -> PipeSlot
+        self.mode = None      # textures affichées (None = mode sélectionné)
+
+    # ==================== Pool ====================
+
+    def build_pool(self, count=PIPE_POOL_SIZE):
+        "Pré-crée des emplacements cachés pour la scène de jeu"
+        for _ in range(count):
+            self._free.append(self._create_slot())
+
+    def _current_mode(self):
+        return self.mode or self.state.selected_mode
+
+    def _current_photos(self):
+        "Textures du mode courant à la hauteur du terrain (cache partagé)"
+        return self.assets.get_pipe_photos(self._current_mode(), self.state.world.height)
+
+    def _create_slot(self):
+        "Crée les items canvas (cachés) d'un emplacement"
+        photos = self._current_photos()
+        top_tk, bot_tk = photos
+
+        # Rectangles (hitboxes)
         top_rect = self.canvas.create_rectangle(
-            x, 0, x + PIPE_WIDTH, top_h, fill="black", tags=("pipe",)
+            0, 0, 0, 0, fill="black", state="hidden", tags=("pipe",)
         )
         bot_rect = self.canvas.create_rectangle(
-            x, bot_y, x + PIPE_WIDTH, h, fill="black", tags=("pipe",)
+            0, 0, 0, 0, fill="black", state="hidden", tags=("pipe",)
+        )
+
+        # Sprites posés sur les rectangles (PhotoImage partagées)
+        top_img = self._create_sprite(top_tk, "sw", "hidden")
+        bot_img = self._create_sprite(bot_tk, "nw", "hidden")
+
+        slot = PipeSlot(top_rect, bot_rect, top_img, bot_img, photos)
+
+        # Placé une fois dans la couche des tuyaux (sous l'oiseau et le HUD)
+        for item in slot.items():
+            self.layers.place(item, "pipes")
+        return slot
+
+    def _create_sprite(self, photo, anchor, state):
+        "Item image d'un tuyau (None si la texture n'est pas encore chargée)"
+        if photo is None:
+            return None
+        return self.canvas.create_image(
+            0, 0, image=photo, anchor=anchor, state=state, tags=("pipe_img",)
         )
-        
-        # Création des sprites a placer sur les rectangles
-        pil_top, pil_bot = self.assets.get_pipe_textures(self.state.selected_mode)
-        
-        top_img_id = bot_img_id = None
-        top_tk = bot_tk = None
-        
-        if pil_top is not None:
-            top_tk = ImageTk.PhotoImage(pil_top)
-            top_img_id = self.canvas.create_image(
-                x, top_h, image=top_tk, anchor="sw", tags=("pipe_img",)
-            )
-        
-        if pil_bot is not None:
-            bot_tk = ImageTk.PhotoImage(pil_bot)
-            bot_img_id = self.canvas.create_image(
-                x, bot_y, image=bot_tk, anchor="nw", tags=("pipe_img",)
-            )
-        
-        # Enregistrement
-        self.state.pipes.append((top_rect, bot_rect, False))
-        self.state.pipe_imgs.append((top_img_id, bot_img_id, top_tk, bot_tk))
-    
-    def move_pipes(self):
-        "Déplace tous les tuyaux et gère le scoring"
-        return_val = 0
-        remove_indices = []
-        dx = -self.state.pipe_speed
-        
-        for i, (top, bot, passed) in enumerate(self.state.pipes):
-            # Déplacer les rectangles
-            self.canvas.move(top, dx, 0)
-            self.canvas.move(bot, dx, 0)
-            
-            # Déplacer les images
-            if i < len(self.state.pipe_imgs):
-                top_img_id, bot_img_id, _, _ = self.state.pipe_imgs[i]
-                if top_img_id:
-                    self.canvas.move(top_img_id, dx, 0)
-                if bot_img_id:
-                    self.canvas.move(bot_img_id, dx, 0)
-            
-            # Coordonnées du tuyau
-            coords = self.canvas.coords(top)
-            if not coords or len(coords) < 4: 
-                remove_indices.append(i)
-                continue
-                
-            x1, y1, x2, y2 = coords
-            
-            # Suppression si hors écran
-            if x2 < 0:
-                remove_indices.append(i)
-                continue
-            
-            # Comptage du score
-            if not passed and x2 < BIRD_X:
-                self.state.pipes[i] = (top, bot, True)
-                self.state.increment_score()
-                self.state.pipe_speed = min(
-                    PIPE_SPEED_MAX, self.state.pipe_speed + 0.05
-                )
-                return_val = 1
-        
-        # Suppression des tuyaux hors écran
-        for idx in reversed(remove_indices):
-            if idx < len(self.state.pipes):
-                t, b, _ = self.state.pipes.pop(idx)
-                self.canvas.delete(t)
-                self.canvas.delete(b)
-                
-                if idx < len(self.state.pipe_imgs):
-                    top_img_id, bot_img_id, _, _ = self.state.pipe_imgs.pop(idx)
-                    if top_img_id:
-                        self.canvas.delete(top_img_id)
-                    if bot_img_id:
-                        self.canvas.delete(bot_img_id)
-
-        return return_val
-
-    def should_spawn_new_pipe(self) -> bool:
-        "Vérifie s'il faut spawner un nouveau tuyau"
-        elapsed_ms = (self.timer.time() - self.state.last_pipe_spawn) * 1000.0
-        return elapsed_ms >= self.state.spawn_every_ms
-    
-    def mark_pipe_spawn(self):
-        "Marque qu'un tuyau vient d'être spawné"
-        self.state.last_pipe_spawn = self.timer.time()
\ No newline at end of file
+
+    def _acquire(self):
+        "Prend un emplacement libre (en crée un si le pool est vide)"
+        slot = self._free.pop() if self._free else self._create_slot()
+        self._set_photos(slot, self._current_photos())
+
+        for item in slot.items():
+            self.canvas.itemconfigure(item, state="normal")
+        return slot
+
+    def _set_photos(self, slot, photos, state="hidden"):
+        "Change l'image des sprites si les textures ont changé (mode, taille, fin de chargement)"
+        if slot.photos == photos:
+            return
+        top_tk, bot_tk = photos
+        if slot.top_img and top_tk is not None:
+            self.canvas.itemconfigure(slot.top_img, image=top_tk)
+        if slot.bot_img and bot_tk is not None:
+            self.canvas.itemconfigure(slot.bot_img, image=bot_tk)
+
+        # Emplacement créé avant le chargement des textures : sprites ajoutés
+        if slot.top_img is None and top_tk is not None:
+            slot.top_img = self.layers.place(self._create_sprite(top_tk, "sw", state), "pipes")
+        if slot.bot_img is None and bot_tk is not None:
+            slot.bot_img = self.layers.place(self._create_sprite(bot_tk, "nw", state), "pipes")
+        slot.photos = photos
+
+    def _release(self, slot):
+        "Cache un emplacement et le remet dans le pool"
+        for item in slot.items():
+            self.canvas.itemconfigure(item, state="hidden")
+        self._free.append(slot)
+
+    # ==================== Synchronisation ====================
+
+    def sync(self, alpha=1.0):
+        "Reporte la position (interpolée) des tuyaux du modèle sur le canvas"
+        world = self.state.world
+        h = world.height
+        alive = set()
+
+        # Textures redimensionnées arrivées (ou nouvelle taille) : mise à jour
+        photos = self._current_photos()
+        for slot in self._active.values():
+            self._set_photos(slot, photos, "normal")
+
+        for pipe in world.pipes:
+            alive.add(pipe.id)
+            slot = self._active.get(pipe.id)
+            if slot is None:
+                slot = self._active[pipe.id] = self._acquire()
+
+            x = pipe.prev_x + (pipe.x - pipe.prev_x) * alpha
+            x2 = x + pipe.width
+            self.canvas.coords(slot.top_rect, x, 0, x2, pipe.top_h)
+            self.canvas.coords(slot.bot_rect, x, pipe.bot_y, x2, h)
+            if slot.top_img:
+                self.canvas.coords(slot.top_img, x, pipe.top_h)
+            if slot.bot_img:
+                self.canvas.coords(slot.bot_img, x, pipe.bot_y)
+
+        # Tuyaux sortis du modèle : retour au pool
+        if len(self._active) > len(alive):
+            for pipe_id in [i for i in self._active if i not in alive]:
+                self._release(self._active.pop(pipe_id))
+
+    def reset(self, mode=None):
+        "Efface les tuyaux affichés et vide le pool (mode = textures à utiliser)"
+        for slot in list(self._active.values()) + self._free:
+            for item in slot.items():
+                self.canvas.delete(item)
+        self._active.clear()
+        self._free.clear()
+        self.mode = mode
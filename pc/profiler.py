@@ -0,0 +1,69 @@
+# profiler.py
+"""
+Profileur de frames : temps de frame glissants et temps passé par phase
+"""
+
+from collections import deque
+from time import perf_counter
+from constants import PROFILER_WINDOW
+
+PHASES = ("physics", "pipes", "collision", "record", "render", "serial")
+
+
+class FrameProfiler:
+    "Accumule les temps de chaque phase puis les range par frame"
+
+    def __init__(self, window=PROFILER_WINDOW):
+        self.enabled = False
+        self.frame_ms = deque(maxlen=window)
+        self.phase_ms = {p: deque(maxlen=window) for p in PHASES}
+        self._current = dict.fromkeys(PHASES, 0.0)
+
+    def toggle(self) -> bool:
+        "Active/désactive la mesure (les fenêtres repartent de zéro)"
+        self.enabled = not self.enabled
+        self.frame_ms.clear()
+        for samples in self.phase_ms.values():
+            samples.clear()
+        self._current = dict.fromkeys(PHASES, 0.0)
+        return self.enabled
+
+    # ==================== Mesure ====================
+
+    def add(self, phase: str, seconds: float):
+        "Ajoute une durée (s) à la phase pour la frame en cours"
+        self._current[phase] += seconds
+
+    def timed(self, phase, func, *args):
+        "Appelle func en comptant sa durée dans la phase (si actif)"
+        if not self.enabled:
+            return func(*args)
+        t0 = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._current[phase] += perf_counter() - t0
+
+    def end_frame(self, frame_ms: float):
+        "Clôt la frame : range son temps total et ses temps par phase (ms)"
+        if not self.enabled:
+            return
+        self.frame_ms.append(frame_ms)
+        current = self._current
+        for phase, samples in self.phase_ms.items():
+            samples.append(current[phase] * 1000.0)
+            current[phase] = 0.0
+
+    # ==================== Statistiques ====================
+
+    def percentiles(self, qs=(50, 95, 99)):
+        "Percentiles (rang le plus proche) du temps de frame, en ms"
+        data = sorted(self.frame_ms)
+        if not data:
+            return [0.0 for _ in qs]
+        n = len(data)
+        return [data[min(n - 1, max(0, -(-q * n // 100) - 1))] for q in qs]
+
+    def phase_means(self):
+        "Temps moyen par frame de chaque phase, en ms"
+        return {p: (sum(s) / len(s) if s else 0.0) for p, s in self.phase_ms.items()}
@@ -4,18 +4,26 @@ Gestion du rendu graphique (menus, bird, HUD)
 """
 
 import math
+import os
 from constants import (
     WIDTH, HEIGHT, BIRD_X, BIRD_RADIUS, MODES,
     MENU_COLOR, TITLE_FONT, MENU_FONT, FOOTER_FONT,
-    SCORE_FONT, SCORE_COLOR, BEST_FONT, BEST_COLOR,
+    SCORE_FONT, SCORE_COLOR, BEST_FONT, BEST_COLOR, PERF_HUD_FONT, PERF_HUD_COLOR,
     GAMEOVER_TITLE_FONT, GAMEOVER_SUBTITLE_FONT, GAMEOVER_SCORE_FONT,
     GAMEOVER_BG_COLOR, GAMEOVER_TITLE_COLOR, GAMEOVER_TEXT_COLOR,
-    GAMEOVER_HIGHLIGHT_COLOR, MENU_ANIMATION_SPEED,
+    GAMEOVER_HIGHLIGHT_COLOR, MENU_ANIMATION_SPEED, MENU_REDRAW_EVERY,
     INFO_CONTROLS, INFO_PANEL_BG, INFO_PANEL_BORDER,
     INFO_TITLE_FONT, INFO_CONTROL_FONT, INFO_KEY_LPT_COLOR, INFO_KEY_PIC_COLOR,
-    INFO_DESC_COLOR, INFO_CLOSE_FONT
+    INFO_DESC_COLOR, INFO_CLOSE_FONT, REPLAY_SPEED
 )
 
+# Couches du canvas, de bas en haut. Chaque couche sauf la dernière a une ancre
+# (item invisible) qui marque son sommet : un item est inséré une fois sous
+# l'ancre de sa couche et n'est plus jamais réempilé. "overlay" est le haut de
+# la liste d'affichage : écrans construits d'un bloc (menu, game over), overlay
+# info et HUD de performance y arrivent d'eux-mêmes puisqu'ils sont créés en dernier.
+LAYERS = ("background", "pipes", "bird", "hud", "overlay")
+
 
 class Renderer:
     "Classe gérant le rendu graphique"
@@ -24,6 +32,66 @@ class Renderer:
         self.canvas = canvas
         self.assets = assets_manager
         self.state = game_state
+        
+        # Ancres des couches (recréées à chaque nouvelle scène)
+        self._anchors = {}
+        self._create_anchors()
+        
+        # Oiseau créé une fois par scène puis déplacé
+        self._bird_item = None
+        self._bird_sprite = None
+        
+        # Fond de jeu : un seul item, image changée seulement au redimensionnement
+        self._play_bg_item = None
+        self._play_bg_img = None
+        
+        # Menu construit une fois par scène (titre animé, entrées recolorées)
+        self._title_items = None
+        self._title_pos = None
+        self._menu_items = []
+        self._menu_selected = None
+        self._replay_choice_item = None
+        
+        # HUD : items créés une fois par scène, texte changé seulement
+        # quand la valeur observée change
+        self._hud = {}
+        game_state.watch("score", lambda v: self._set_hud_text("score", self._score_text(v)))
+        game_state.watch("best_score", lambda v: self._set_hud_text("best", self._best_text(v)))
+        game_state.watch("replay_progress", lambda v: self._set_hud_text("replay", self._replay_text(v)))
+        game_state.watch("selected_mode", self._on_mode_changed)
+    
+    def clear_canvas(self):
+        "Efface tout le canvas (nouvelle scène)"
+        self.canvas.delete("all")
+        self._create_anchors()
+        self._bird_item = None
+        self._bird_sprite = None
+        self._play_bg_item = None
+        self._play_bg_img = None
+        self._title_items = None
+        self._title_pos = None
+        self._menu_items = []
+        self._menu_selected = None
+        self._replay_choice_item = None
+        self._hud.clear()
+    
+    # ==================== Couches ====================
+    
+    def _create_anchors(self):
+        "Crée les ancres des couches, dans l'ordre, sur un canvas vide"
+        self._anchors = {
+            name: self.canvas.create_line(
+                0, 0, 0, 0, state="hidden", tags=("layer", f"layer_{name}")
+            )
+            for name in LAYERS[:-1]
+        }
+    
+    def place(self, item, layer):
+        "Insère un item (ou un tag) au sommet de sa couche, une seule fois à la création"
+        anchor = self._anchors.get(layer)
+        if anchor is not None:
+            self.canvas.tag_lower(item, anchor)
+        return item
     
     # ==================== Backgrounds ====================
     
@@ -35,36 +103,39 @@ class Renderer:
         bg_img = self.assets.get_background_image("menu", w, h)
         if bg_img:
             self.canvas.delete("menu_bg")
-            self.canvas.create_image(
+            self.place(self.canvas.create_image(
                 0, 0, image=bg_img, anchor="nw", tags=("menu_bg",)
-            )
-            self.canvas.tag_lower("menu_bg")
+            ), "background")
     
     def draw_play_background(self):
-        "Dessine le fond d'écran de jeu"
+        "Place le fond de jeu (créé une fois par scène, mis à jour si la taille change)"
         w = self.canvas.winfo_width() or WIDTH
         h = self.canvas.winfo_height() or HEIGHT
         
         bg_img = self.assets.get_background_image("play", w, h)
-        if bg_img:
-            self.canvas.delete("play_bg")
-            self.canvas.create_image(
+        if not bg_img or bg_img is self._play_bg_img:
+            return
+        
+        if self._play_bg_item is None:
+            self._play_bg_item = self.place(self.canvas.create_image(
                 0, 0, image=bg_img, anchor="nw", tags=("play_bg",)
-            )
-            self.canvas.tag_lower("play_bg")
+            ), "background")
+        else:
+            self.canvas.itemconfigure(self._play_bg_item, image=bg_img)
+        self._play_bg_img = bg_img
     
     # ==================== Menu ====================
     
+    def _title_y(self, h) -> int:
+        "Hauteur du titre flottant (sinus)"
+        return int(int(h * 0.18) + math.sin(self.state.menu_animation_offset * 0.05) * 10)
+    
     def draw_title(self, w, h):
-        "Dessine le titre du jeu avec effet d'animation du menu"
-        # Animation flottante (sinus)
-        self.state.menu_animation_offset += MENU_ANIMATION_SPEED
-        y_offset = math.sin(self.state.menu_animation_offset * 0.05) * 10
-        
-        title_y = int(h * 0.18) + y_offset
+        "Dessine le titre du jeu (déplacé ensuite par animate_title)"
+        title_y = self._title_y(h)
         
         # Ombre du titre
-        self.canvas.create_text(
+        shadow = self.canvas.create_text(
             w // 2 + 4, title_y + 4,
             text="FLARRY-BIRD",
             font=TITLE_FONT,
@@ -73,13 +144,32 @@ class Renderer:
         )
         
         # Titre principal
-        self.canvas.create_text(
+        title = self.canvas.create_text(
             w // 2, title_y,
             text="FLARRY-BIRD",
             font=TITLE_FONT,
             fill=MENU_COLOR,
             tags=("title",)
         )
+        self._title_items = (shadow, title)
+        self._title_pos = (w, h, title_y)
+    
+    def animate_title(self):
+        "Fait flotter le titre : simple déplacement, seulement si la position change"
+        if self._title_items is None:
+            return
+        # Même vitesse qu'avant : +1 par frame et +MENU_ANIMATION_SPEED au
+        # redessin du menu, fait une frame sur MENU_REDRAW_EVERY
+        self.state.menu_animation_offset += 1 + MENU_ANIMATION_SPEED / MENU_REDRAW_EVERY
+        w, h, last_y = self._title_pos
+        title_y = self._title_y(h)
+        if title_y == last_y:
+            return
+        
+        shadow, title = self._title_items
+        self.canvas.coords(shadow, w // 2 + 4, title_y + 4)
+        self.canvas.coords(title, w // 2, title_y)
+        self._title_pos = (w, h, title_y)
     
     def draw_footer(self, w, h):
         "Dessine le pied de page du menu"
@@ -90,41 +180,50 @@ class Renderer:
             fill=MENU_COLOR
         )
     
+    @staticmethod
+    def _menu_item_style(is_sel):
+        "Police et couleur d'une entrée du menu"
+        if is_sel:
+            return (MENU_FONT[0], MENU_FONT[1], "bold"), MENU_COLOR
+        return (MENU_FONT[0], MENU_FONT[1], "normal"), "#CCCCCC"
+    
+    def _replay_choice_text(self):
+        "Libellé du replay sélectionné ([L] pour changer)"
+        path = self.state.selected_replay_path()
+        if path is None:
+            label = "dernière partie"
+        else:
+            name = os.path.basename(path)
+            label = f"{name} ({self.state.replay_choice_idx + 1}/{len(self.state.replay_choices)})"
+        return f"[L] Replay : {label}"
+    
     def render_menu(self):
-        "Affiche le menu principal avec effets visuels"
+        "Affiche le menu principal (construit une fois, puis seulement mis à jour)"
+        if self._menu_items:
+            self._update_menu()
+            return
+        
         w = self.canvas.winfo_width() or WIDTH
         h = self.canvas.winfo_height() or HEIGHT
         
         top_y = int(h * 0.38)
         gap_y = 70
         
-        # Nettoyage
-        for i in range(len(MODES)):
-            self.canvas.delete(f"menu_item_{i}")
-            self.canvas.delete(f"menu_box_{i}")
-        self.canvas.delete("menu_box_all")
-        self.canvas.delete("press_start")
-        self.canvas.delete("best_menu")
-        self.canvas.delete("controls")
-        
         # Items de menu
         for i, name in enumerate(MODES):
             y = top_y + i * gap_y
-            tag_text = f"menu_item_{i}"
             is_sel = (i == self.state.selected_idx)
             
             # Texte du mode
-            style = (MENU_FONT[0], MENU_FONT[1], "bold") if is_sel else (MENU_FONT[0], MENU_FONT[1], "normal")
-            color = MENU_COLOR if is_sel else "#CCCCCC"
-            
-    
-            self.canvas.create_text(
+            style, color = self._menu_item_style(is_sel)
+            self._menu_items.append(self.canvas.create_text(
                 w // 2, y,
                 text=f"{name}",
                 font=style,
                 fill=color,
-                tags=tag_text
-            )
+                tags=f"menu_item_{i}"
+            ))
+        self._menu_selected = self.state.selected_idx
         
         # Instructions "Press 🟡 to start"
         hint_y = top_y + len(MODES) * gap_y - 50
@@ -137,115 +236,147 @@ class Renderer:
             tags=("press_start",)
         )
         
+        # Replay sélectionné ([L] pour changer)
+        self._replay_choice_item = self.canvas.create_text(
+            w // 2, hint_y + gap_y + 70,
+            text=self._replay_choice_text(),
+            font=FOOTER_FONT,
+            fill="#CCCCCC",
+            tags=("replay_choice",)
+        )
+        
         self.state.blink_on = True
         self.set_tag_visible("press_start", True)
     
+    def _update_menu(self):
+        "Recolore l'entrée sélectionnée et met à jour le libellé du replay"
+        sel = self.state.selected_idx
+        if sel != self._menu_selected:
+            for i in (self._menu_selected, sel):
+                if i is not None and 0 <= i < len(self._menu_items):
+                    style, color = self._menu_item_style(i == sel)
+                    self.canvas.itemconfigure(self._menu_items[i], font=style, fill=color)
+            self._menu_selected = sel
+        
+        self.canvas.itemconfigure(self._replay_choice_item, text=self._replay_choice_text())
+    
     # ==================== Bird ====================
     
-    def draw_bird(self):
-        "Dessine l'oiseau"
+    def draw_bird(self, alpha=None):
+        "Dessine l'oiseau (position interpolée si alpha est fourni)"
         x = BIRD_X
-        y = int(self.state.bird_y)
+        if alpha is None:
+            y = int(self.state.bird_y)
+        else:
+            y = int(self.state.world.interp_bird_y(alpha))
         r = BIRD_RADIUS
+        sprite = self.assets.bird_tk
+        item = self._bird_item
         
-        # Nettoyage
-        for t in ("bird_img", "bird_hit"):
-            for it in self.canvas.find_withtag(t):
-                self.canvas.delete(it)
+        # Passage sprite <-> cercle de secours : on recrée l'item
+        if item is not None and (sprite is None) != (self._bird_sprite is None):
+            self.canvas.delete(item)
+            item = None
         
-        # Sprite (visuel)
-        if self.assets.bird_tk:
-            self.canvas.create_image(
-                x, y, image=self.assets.bird_tk, anchor="center", tags=("bird_img",)
-            )
-        else:
-            # Fallback si sprite absent
-            self.canvas.create_oval(
-                x - r, y - r, x + r, y + r, fill="black", tags=("bird_img",)
-            )
+        if item is None:
+            if sprite:
+                item = self.canvas.create_image(
+                    x, y, image=sprite, anchor="center", tags=("bird_img",)
+                )
+            else:
+                # Fallback si sprite absent
+                item = self.canvas.create_oval(
+                    x - r, y - r, x + r, y + r, fill="black", tags=("bird_img",)
+                )
+            self._bird_item = self.place(item, "bird")
+            self._bird_sprite = sprite
+            return
         
-        # Hitbox (cercle invisible)
-        self.canvas.create_oval(
-            x - r, y - r, x + r, y + r,
-            outline="", fill="", width=0,
-            tags=("bird_hit",)
-        )
+        # Déplacement (et changement d'image si le sprite a changé)
+        if sprite:
+            if sprite is not self._bird_sprite:
+                self.canvas.itemconfigure(item, image=sprite)
+                self._bird_sprite = sprite
+            self.canvas.coords(item, x, y)
+        else:
+            self.canvas.coords(item, x - r, y - r, x + r, y + r)
     
     # ==================== HUD ====================
     
-    def update_score_hud(self):
-        "Met à jour l'affichage du score"
+    def layout_hud(self, replay=False):
+        "Place le HUD (créé une fois par scène, repositionné au redimensionnement)"
         w = self.canvas.winfo_width() or WIDTH
         
-        items = self.canvas.find_withtag("score_hud")
-        if items:
-            self.canvas.itemconfigure(
-                items[0], 
-                text=f"Score : {self.state.score}", 
-                font=SCORE_FONT, 
-                fill=SCORE_COLOR
-            )
-            self.canvas.coords(items[0], w // 2, 50)
+        self._hud_text("score", w // 2, 50, self._score_text(self.state.score),
+                       SCORE_FONT, SCORE_COLOR, ("score_hud", "hud"))
+        if replay:
+            # Indicateur REPLAY en haut à gauche
+            self._hud_text("replay", 20, 30, self._replay_text(self.state.replay_progress),
+                           ("VT323", 40, "bold"), "#FF4444", ("replay_indicator", "hud"), anchor="nw")
         else:
-            self.canvas.create_text(
-                w // 2, 50,
-                text=f"Score : {self.state.score}",
-                font=SCORE_FONT,
-                fill=SCORE_COLOR,
-                tags=("score_hud",)
-            )
-        
-        self.canvas.tag_raise("score_hud")
-
-
+            self._hud_text("best", w // 2, 95, self._best_text(self.state.best_score),
+                           BEST_FONT, BEST_COLOR, ("best_hud", "hud"))
+    
+    def _hud_text(self, key, x, y, text, font, fill, tags, anchor="center"):
+        "Crée un texte du HUD ou le repositionne s'il existe déjà"
+        item = self._hud.get(key)
+        if item is None:
+            self._hud[key] = self.place(self.canvas.create_text(
+                x, y, text=text, font=font, fill=fill, anchor=anchor, tags=tags
+            ), "hud")
+        else:
+            self.canvas.coords(item, x, y)
+    
+    def _set_hud_text(self, key, text):
+        item = self._hud.get(key)
+        if item is not None:
+            self.canvas.itemconfigure(item, text=text)
+    
+    @staticmethod
+    def _score_text(score):
+        return f"Score : {score}"
+    
+    @staticmethod
+    def _best_text(best):
+        return f"Best : {best}"
+    
+    @staticmethod
+    def _replay_text(progress):
+        return f"🎬 REPLAY x{REPLAY_SPEED:g}  {progress}%"
+    
+    def _on_mode_changed(self, mode):
+        if self._menu_items:
+            self._update_menu()
 
-    def update_replay_hud(self):
-        "Affiche le HUD pendant le replay"
+    def update_perf_hud(self, profiler, scheduler, item_count: int):
+        "Met à jour le HUD de performance (percentiles, phases, cadence, items canvas)"
         w = self.canvas.winfo_width() or WIDTH
+        p50, p95, p99 = profiler.percentiles()
+        ph = profiler.phase_means()
+        text = (
+            f"frame p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms\n"
+            f"physics {ph['physics']:.3f}  pipes {ph['pipes']:.3f}  collision {ph['collision']:.3f}\n"
+            f"record {ph['record']:.3f}  render {ph['render']:.3f}  serial {ph['serial']:.3f}\n"
+            f"fps {scheduler.fps:.1f}  jitter {scheduler.jitter_ms:.2f} ms  "
+            f"skipped {scheduler.skipped_renders}\n"
+            f"items {item_count}  missed {scheduler.missed_deadlines}"
+        )
         
-        # Indicateur REPLAY en haut à gauche
-        items_replay = self.canvas.find_withtag("replay_indicator")
-        if items_replay:
-            self.canvas.itemconfigure(
-                items_replay[0],
-                text="🎬 REPLAY x2",
-                font=("VT323", 40, "bold"),
-                fill="#FF4444"
-            )
-            self.canvas.coords(items_replay[0], 20, 30)
-        else:
-            self.canvas.create_text(
-                20, 30,
-                text="🎬 REPLAY",
-                font=("VT323", 40, "bold"),
-                fill="#FF4444",
-                anchor="nw",
-                tags=("replay_indicator", "hud")
-            )
-        
-        # Score du replay au centre
-        items_score = self.canvas.find_withtag("replay_score")
-        if items_score:
-            self.canvas.itemconfigure(
-                items_score[0],
-                text=f"Score : {self.state.score}",
-                font=SCORE_FONT,
-                fill=SCORE_COLOR
-            )
-            self.canvas.coords(items_score[0], w // 2, 50)
+        items = self.canvas.find_withtag("perf_hud")
+        if items:
+            self.canvas.itemconfigure(items[0], text=text)
+            self.canvas.coords(items[0], w - 20, 20)
         else:
             self.canvas.create_text(
-                w // 2, 50,
-                text=f"Score : {self.state.score}",
-                font=SCORE_FONT,
-                fill=SCORE_COLOR,
-                tags=("replay_score", "hud")
+                w - 20, 20,
+                text=text,
+                font=PERF_HUD_FONT,
+                fill=PERF_HUD_COLOR,
+                anchor="ne",
+                justify="right",
+                tags=("perf_hud",)
             )
-        
-        # Remonter tous les éléments HUD au-dessus
-        self.canvas.tag_raise("hud")
 
-    
     # ==================== Game Over ====================
     
     def render_game_over(self):
@@ -253,7 +384,7 @@ class Renderer:
         w = self.canvas.winfo_width() or WIDTH
         h = self.canvas.winfo_height() or HEIGHT
 
-        self.canvas.delete("all")
+        self.clear_canvas()
 
         # Fond assombri
         self.canvas.create_rectangle(0, 0, w, h, fill=GAMEOVER_BG_COLOR, stipple="gray50", tags=("gameover_bg",))
@@ -335,10 +466,10 @@ class Renderer:
             fill=GAMEOVER_HIGHLIGHT_COLOR if m == self.state.selected_mode else "#AAAAAA",
             anchor="w", tags=("best_list",))
 
-        # Instruction (sous le panneau)
-        if self.state.blink_on:
-            self.canvas.create_text(w // 2, panel_y2 + 60, text="Press 🟢 to return to menu",
-            font=GAMEOVER_SUBTITLE_FONT, fill=GAMEOVER_TEXT_COLOR, tags=("instructions",))
+        # Instruction (sous le panneau, clignotement par blink_loop)
+        self.canvas.create_text(w // 2, panel_y2 + 60, text="Press 🟢 to return to menu",
+        font=GAMEOVER_SUBTITLE_FONT, fill=GAMEOVER_TEXT_COLOR, tags=("instructions",),
+        state=("normal" if self.state.blink_on else "hidden"))
 
     # ==================== Info Overlay ====================
     
@@ -457,9 +588,6 @@ class Renderer:
                 fill=INFO_KEY_LPT_COLOR,
                 tags=("info_overlay", "info_close"),
             )
-        
-        # S'assurer que l'overlay est au-dessus de tout
-        self.canvas.tag_raise("info_overlay")
     
     # ==================== Utilitaires ====================
     
@@ -470,7 +598,9 @@ class Renderer:
     
     def clear_playfield(self):
         "Nettoie le terrain de jeu"
-        for tag in ("bird", "bird_img", "bird_hit", "pipe", "pipe_img", "hud", "score_hud", "best_hud"):
+        for tag in ("bird", "bird_img", "pipe", "pipe_img", "hud", "score_hud", "best_hud"):
             for it in self.canvas.find_withtag(tag):
                 self.canvas.delete(it)
-        self.state.pipe_imgs.clear()
+        self._bird_item = None
+        self._bird_sprite = None
+        self._hud.clear()
@@ -0,0 +1,269 @@
+# replay_file.py
+"""
+Format binaire des replays sauvegardés et lecture par mmap.
+
+Disposition du fichier (petit-boutiste) :
+    en-tête     HEADER (68 octets)
+    frames      frame_count x FRAME (bird_y, vy, défilement, score)
+    index       index_count x u32 : première ligne de tuyau vivante toutes
+                les INDEX_STRIDE frames (accès direct à n'importe quelle frame)
+    tuyaux      pipe_count x PIPE
+
+Les journaux d'entrées (INPUT_EXTENSION) ne contiennent que la graine, les
+dimensions et les pas des sauts : la partie est re-simulée à la lecture.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from world import Pipe
+from input_log import InputLog
+
+MAGIC = b"FBRP"
+VERSION = 2          # v2 : dimensions du terrain dans l'en-tête
+INDEX_STRIDE = 64
+EXTENSION = ".fbr"
+
+# magic, version, taille en-tête, mode, date, nb frames, nb tuyaux, nb index,
+# score final, pas de l'index, offsets frames/tuyaux/index, largeur, hauteur
+# du terrain, durée d'un pas (ms)
+HEADER = struct.Struct("<4sHH16sdIIIHHIIIHHf")
+FRAME = struct.Struct("<fffH")
+PIPE = struct.Struct("<IIiffHHH")
+INDEX = struct.Struct("<I")
+
+INPUT_MAGIC = b"FBIN"
+INPUT_VERSION = 1
+INPUT_EXTENSION = ".fbi"
+# magic, version, taille en-tête, mode, date, graine, nb pas, nb sauts,
+# nb redimensionnements, score final, largeur, hauteur, durée d'un pas (ms)
+INPUT_HEADER = struct.Struct("<4sHH16sdIIIHHHHf")
+RESIZE = struct.Struct("<IHH")
+
+
+def write_replay(path, store, mode, final_score, tick_ms):
+    "Écrit les frames conservées d'un ReplayStore dans un fichier binaire"
+    first = store.first_frame
+    n = len(store)
+
+    # Tuyaux présents dans la fenêtre conservée
+    rows = [r for r in range(len(store.pipe_id))
+            if store.pipe_despawn[r] == -1 or store.pipe_despawn[r] > first]
+
+    width, height = store.field_at(first)
+    index_count = (n + INDEX_STRIDE - 1) // INDEX_STRIDE
+    frames_offset = HEADER.size
+    index_offset = frames_offset + n * FRAME.size
+    pipes_offset = index_offset + index_count * INDEX.size
+    buf = bytearray(pipes_offset + len(rows) * PIPE.size)
+
+    HEADER.pack_into(
+        buf, 0, MAGIC, VERSION, HEADER.size, mode.encode("ascii", "replace")[:16],
+        time.time(), n, len(rows), index_count, min(final_score, 0xFFFF),
+        INDEX_STRIDE, frames_offset, pipes_offset, index_offset, width, height, tick_ms
+    )
+
+    # Frames (ordre chronologique, même si le tampon a tourné)
+    off = frames_offset
+    for f in range(first, first + n):
+        bird_y, vy, score = store.frame(f)
+        FRAME.pack_into(buf, off, bird_y, vy, store.scroll_at(f), score)
+        off += FRAME.size
+
+    # Tuyaux (frames relatives au début du fichier)
+    off = pipes_offset
+    for r in rows:
+        despawn = store.pipe_despawn[r]
+        PIPE.pack_into(
+            buf, off, store.pipe_id[r], max(store.pipe_spawn[r] - first, 0),
+            despawn - first if despawn != -1 else -1,
+            store.pipe_x0[r], store.pipe_scroll0[r],
+            store.pipe_top_h[r], store.pipe_bot_y[r], store.pipe_width[r]
+        )
+        off += PIPE.size
+
+    # Index : première ligne vivante toutes les INDEX_STRIDE frames
+    row = 0
+    for k in range(index_count):
+        f = k * INDEX_STRIDE
+        while row < len(rows):
+            despawn = store.pipe_despawn[rows[row]]
+            if despawn == -1 or despawn - first > f:
+                break
+            row += 1
+        INDEX.pack_into(buf, index_offset + k * INDEX.size, row)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(buf)
+    os.replace(tmp, path)
+
+
+class ReplayFile:
+    """
+    Replay sauvegardé, lu à la demande via mmap (rien n'est décodé à l'ouverture).
+    Même interface de lecture que ReplayStore.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._fh.close()
+            raise ValueError(f"Replay vide : {path}")
+
+        size = len(self._mm)
+        if size < HEADER.size:
+            self.close()
+            raise ValueError(f"Replay tronqué : {path}")
+
+        (magic, version, _, mode, created, self.frame_count, self.pipe_count,
+         self.index_count, self.final_score, self.index_stride, self._frames_off,
+         self._pipes_off, self._index_off, self.width, self.height,
+         self.tick_ms) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Format de replay non reconnu : {path}")
+        if self.width <= 1 or self.height <= 1:
+            self.close()
+            raise ValueError(f"Replay abîmé (terrain {self.width}x{self.height}) : {path}")
+
+        # Chaque table doit tenir dans le fichier (fichier tronqué ou abîmé)
+        tables = ((self._frames_off, self.frame_count * FRAME.size),
+                  (self._index_off, self.index_count * INDEX.size),
+                  (self._pipes_off, self.pipe_count * PIPE.size))
+        if any(off < HEADER.size or off + length > size for off, length in tables) \
+                or (self.index_count and self.index_stride == 0):
+            self.close()
+            raise ValueError(f"Replay tronqué : {path}")
+
+        self.mode = mode.rstrip(b"\0").decode("ascii", "replace")
+        self.created = created
+        self.first_frame = 0
+        self.total_frames = self.frame_count
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._fh.close()
+
+    def __len__(self):
+        return self.frame_count
+
+    def field_at(self, f):
+        "Dimensions (largeur, hauteur) du terrain enregistré"
+        return self.width, self.height
+
+    # ==================== Lecture ====================
+
+    def frame(self, f):
+        "Retourne (bird_y, vy, score) de la frame f"
+        bird_y, vy, _, score = FRAME.unpack_from(self._mm, self._frames_off + f * FRAME.size)
+        return bird_y, vy, score
+
+    def scroll_at(self, f) -> float:
+        return FRAME.unpack_from(self._mm, self._frames_off + f * FRAME.size)[2]
+
+    def _pipe(self, row):
+        return PIPE.unpack_from(self._mm, self._pipes_off + row * PIPE.size)
+
+    def first_row_alive_at(self, f, start_row=0) -> int:
+        "Première ligne de la table encore vivante à la frame f"
+        if start_row == 0 and self.index_count:
+            k = min(f // self.index_stride, self.index_count - 1)
+            start_row = INDEX.unpack_from(self._mm, self._index_off + k * INDEX.size)[0]
+        row = start_row
+        while row < self.pipe_count:
+            despawn = self._pipe(row)[2]
+            if despawn == -1 or despawn > f:
+                break
+            row += 1
+        return row
+
+    def pipes_at(self, f, start_row=0):
+        "Retourne les tuyaux (Pipe) présents à la frame f"
+        scroll = self.scroll_at(f)
+        out = []
+        for row in range(start_row, self.pipe_count):
+            pipe_id, spawn, despawn, x0, scroll0, top_h, bot_y, width = self._pipe(row)
+            if spawn > f:
+                break
+            if despawn != -1 and despawn <= f:
+                continue
+            out.append(Pipe(pipe_id, x0 - (scroll - scroll0), top_h, bot_y, width))
+        return out
+
+
+def write_inputs(path, log):
+    "Écrit un journal d'entrées (InputLog) dans un fichier binaire"
+    buf = bytearray(INPUT_HEADER.pack(
+        INPUT_MAGIC, INPUT_VERSION, INPUT_HEADER.size, log.mode.encode("ascii", "replace")[:16],
+        time.time(), log.seed, log.ticks, len(log.flaps), len(log.resizes),
+        min(log.final_score, 0xFFFF), log.width, log.height, log.tick_ms
+    ))
+    buf += log.flaps.tobytes() if sys.byteorder == "little" else _swapped(log.flaps)
+    for tick, width, height in log.resizes:
+        buf += RESIZE.pack(tick, width, height)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(buf)
+    os.replace(tmp, path)
+
+
+def read_inputs(path):
+    "Lit un journal d'entrées sauvegardé"
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if len(data) < INPUT_HEADER.size:
+        raise ValueError(f"Journal d'entrées tronqué : {path}")
+
+    (magic, version, header_size, mode, _, seed, ticks, n_flaps, n_resizes,
+     final_score, width, height, tick_ms) = INPUT_HEADER.unpack_from(data, 0)
+    if magic != INPUT_MAGIC or version != INPUT_VERSION:
+        raise ValueError(f"Format de journal non reconnu : {path}")
+    if header_size < INPUT_HEADER.size \
+            or len(data) < header_size + n_flaps * 4 + n_resizes * RESIZE.size:
+        raise ValueError(f"Journal d'entrées tronqué : {path}")
+
+    log = InputLog(seed, mode.rstrip(b"\0").decode("ascii", "replace"), width, height, tick_ms)
+    log.ticks = ticks
+    log.final_score = final_score
+    off = header_size
+    log.flaps.frombytes(data[off:off + n_flaps * 4])
+    if sys.byteorder != "little":
+        log.flaps.byteswap()
+    off += n_flaps * 4
+    for _ in range(n_resizes):
+        log.resizes.append(RESIZE.unpack_from(data, off))
+        off += RESIZE.size
+    return log
+
+
+def _swapped(values):
+    swapped = array("I", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def list_replays(directory):
+    """
+    Liste les replays sauvegardés, un par partie (plus récent en premier).
+    Quand une partie a les deux fichiers, le journal d'entrées (.fbi) est choisi.
+    """
+    if not os.path.isdir(directory):
+        return []
+    games = {}
+    for name in os.listdir(directory):
+        stem, ext = os.path.splitext(name)
+        if ext == INPUT_EXTENSION or (ext == EXTENSION and stem not in games):
+            games[stem] = os.path.join(directory, name)
+    return sorted(games.values(), key=os.path.getmtime, reverse=True)
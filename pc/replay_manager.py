@@ -3,122 +3,376 @@
 Gestion du système de replay
 """
 
-from constants import MAX_REPLAY_FRAMES, REPLAY_SPEED
+import os
+import time
+from array import array
+from world import Pipe
+from input_log import InputLog
+from replay_file import (
+    ReplayFile, write_replay, write_inputs, read_inputs, list_replays,
+    EXTENSION, INPUT_EXTENSION
+)
+from constants import REPLAY_RING_FRAMES, REPLAY_SPEED, REPLAY_DIR, SIM_TICK_MS, WIDTH, HEIGHT
+
+
+class ReplayStore:
+    """
+    Stockage en colonnes d'un replay.
+    Par frame : bird_y, vy, défilement cumulé des tuyaux (float32) et score
+    (uint16), soit 14 octets. Les tuyaux sont dans une table séparée, une ligne
+    par tuyau (frames d'apparition/disparition, géométrie). Avec une capacité,
+    les frames forment un tampon circulaire qui garde les plus récentes.
+    """
+
+    FRAME_BYTES = 4 + 4 + 4 + 2
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        "Vide le replay"
+        cap = self.capacity or 0
+        # Colonnes des frames (pré-allouées si tampon circulaire)
+        self.bird_y = array("f", bytes(4 * cap))
+        self.vy = array("f", bytes(4 * cap))
+        self.scroll = array("f", bytes(4 * cap))
+        self.score = array("H", bytes(2 * cap))
+        self.total_frames = 0  # frames enregistrées depuis le début
+
+        # Table des tuyaux (triée par id = ordre d'apparition)
+        self.pipe_id = array("I")
+        self.pipe_spawn = array("I")     # première frame où le tuyau existe
+        self.pipe_despawn = array("i")   # première frame où il n'existe plus (-1 = vivant)
+        self.pipe_x0 = array("f")        # x à la frame d'apparition
+        self.pipe_scroll0 = array("f")   # défilement cumulé à cette frame
+        self.pipe_top_h = array("H")
+        self.pipe_bot_y = array("H")
+        self.pipe_width = array("H")
+        self._live_row = 0               # première ligne encore vivante
+
+        # Dimensions du terrain : (frame, largeur, hauteur) à chaque changement
+        self.resizes = []
+        self._field_w = self._field_h = None
+
+    # ==================== Dimensions ====================
+
+    def __len__(self):
+        if self.capacity:
+            return min(self.total_frames, self.capacity)
+        return self.total_frames
+
+    @property
+    def first_frame(self) -> int:
+        "Numéro absolu de la plus ancienne frame conservée"
+        return self.total_frames - len(self)
+
+    def nbytes(self) -> int:
+        "Mémoire occupée par les colonnes (octets)"
+        cols = (self.bird_y, self.vy, self.scroll, self.score,
+                self.pipe_id, self.pipe_spawn, self.pipe_despawn, self.pipe_x0,
+                self.pipe_scroll0, self.pipe_top_h, self.pipe_bot_y, self.pipe_width)
+        return sum(c.itemsize * len(c) for c in cols)
+
+    # ==================== Enregistrement ====================
+
+    def append(self, world, score):
+        "Ajoute l'état courant du monde comme nouvelle frame"
+        f = self.total_frames
+        scroll = world.scroll
+
+        if self.capacity:
+            i = f % self.capacity
+            self.bird_y[i] = world.bird_y
+            self.vy[i] = world.vy
+            self.scroll[i] = scroll
+            self.score[i] = min(score, 0xFFFF)
+        else:
+            self.bird_y.append(world.bird_y)
+            self.vy.append(world.vy)
+            self.scroll.append(scroll)
+            self.score.append(min(score, 0xFFFF))
+
+        if world.width != self._field_w or world.height != self._field_h:
+            self._field_w, self._field_h = world.width, world.height
+            self.resizes.append((f, world.width, world.height))
+
+        pipes = world.pipes
+
+        # Tuyaux disparus (toujours les plus anciens)
+        first_id = pipes[0].id if pipes else None
+        ids = self.pipe_id
+        while self._live_row < len(ids) and (first_id is None or ids[self._live_row] < first_id):
+            self.pipe_despawn[self._live_row] = f
+            self._live_row += 1
+
+        # Nouveaux tuyaux (toujours les plus à droite)
+        last_id = ids[-1] if ids else -1
+        start = len(pipes)
+        while start > 0 and pipes[start - 1].id > last_id:
+            start -= 1
+        for k in range(start, len(pipes)):
+            p = pipes[k]
+            self.pipe_id.append(p.id)
+            self.pipe_spawn.append(f)
+            self.pipe_despawn.append(-1)
+            self.pipe_x0.append(p.x)
+            self.pipe_scroll0.append(scroll)
+            self.pipe_top_h.append(int(p.top_h))
+            self.pipe_bot_y.append(int(p.bot_y))
+            self.pipe_width.append(int(p.width))
+
+        self.total_frames = f + 1
+        if self.capacity and f >= self.capacity:
+            self._drop_old_pipes()
+
+    def _drop_old_pipes(self):
+        "Supprime les tuyaux disparus avant la plus ancienne frame conservée"
+        first = self.first_frame
+        n = 0
+        while n < self._live_row and self.pipe_despawn[n] <= first:
+            n += 1
+        if n >= 64:  # compactage par blocs
+            for col in (self.pipe_id, self.pipe_spawn, self.pipe_despawn, self.pipe_x0,
+                        self.pipe_scroll0, self.pipe_top_h, self.pipe_bot_y, self.pipe_width):
+                del col[:n]
+            self._live_row -= n
+
+    # ==================== Lecture ====================
+
+    def frame(self, f):
+        "Retourne (bird_y, vy, score) de la frame absolue f"
+        i = f % self.capacity if self.capacity else f
+        return self.bird_y[i], self.vy[i], self.score[i]
+
+    def scroll_at(self, f) -> float:
+        i = f % self.capacity if self.capacity else f
+        return self.scroll[i]
+
+    def field_at(self, f):
+        "Dimensions (largeur, hauteur) du terrain à la frame absolue f"
+        field = (WIDTH, HEIGHT)
+        for frame, w, h in self.resizes:
+            if frame > f:
+                break
+            field = (w, h)
+        return field
+
+    def pipes_at(self, f, start_row=0):
+        "Retourne les tuyaux (Pipe) présents à la frame absolue f"
+        scroll = self.scroll_at(f)
+        out = []
+        for row in range(start_row, len(self.pipe_id)):
+            if self.pipe_spawn[row] > f:
+                break
+            despawn = self.pipe_despawn[row]
+            if despawn != -1 and despawn <= f:
+                continue
+            x = self.pipe_x0[row] - (scroll - self.pipe_scroll0[row])
+            out.append(Pipe(self.pipe_id[row], x, self.pipe_top_h[row],
+                            self.pipe_bot_y[row], self.pipe_width[row]))
+        return out
+
+    def first_row_alive_at(self, f, start_row=0) -> int:
+        "Première ligne de la table encore vivante à la frame f"
+        row = start_row
+        while row < len(self.pipe_id):
+            despawn = self.pipe_despawn[row]
+            if despawn == -1 or despawn > f:
+                break
+            row += 1
+        return row
 
 
 class ReplayManager:
     "Gère l'enregistrement et la lecture des replays"
-    
+
     def __init__(self):
-        self.frames = []  # Liste des frames enregistrées
+        self.store = ReplayStore(REPLAY_RING_FRAMES)
+        self.inputs = None        # entrées de la dernière partie (graine + sauts)
+        self.source = self.store  # replay lu : partie en mémoire ou fichier
+        self.mode = None          # mode de jeu du replay
+        self._last_game_mode = None
         self.current_index = 0
         self.is_recording = False
         self.is_playing = False
         self.replay_speed = REPLAY_SPEED
-    
-    def start_recording(self):
+        self._play_row = 0
+
+    def start_recording(self, mode=None, world=None):
         "Démarre l'enregistrement d'un replay"
-        self.frames = []
+        self._close_file()
+        self.store.clear()
+        self.inputs = InputLog.for_world(world, mode or "") if world is not None else None
+        self.mode = self._last_game_mode = mode
         self.is_recording = True
         self.is_playing = False
         print("[REPLAY] Enregistrement démarré")
-    
+
     def stop_recording(self):
         "Arrête l'enregistrement"
         self.is_recording = False
-        print(f"[REPLAY] Enregistrement arrêté - {len(self.frames)} frames")
-    
-    def record_frame(self, bird_y, vy, pipes_data, score, canvas):
-        "Enregistre une frame de gameplay"
+        print(f"[REPLAY] Enregistrement arrêté - {len(self.store)} frames "
+              f"({self.store.nbytes()} octets)")
+
+    def record_frame(self, world, score):
+        "Enregistre une frame de gameplay (aucune allocation de dict)"
         if not self.is_recording:
             return
-        
-        # Limite mémoire
-        if len(self.frames) >= MAX_REPLAY_FRAMES:
-            return
-        
-        # Enregistrer l'état de la frame avec les positions des tuyaux
-        frame = {
-            'bird_y': bird_y,
-            'vy': vy,
-            'pipes': self._copy_pipes_data(pipes_data, canvas),
-            'score': score
-        }
-        self.frames.append(frame)
-    
-    def _copy_pipes_data(self, pipes_data, canvas):
-        "Copie les données des tuyaux avec leurs positions"
-        pipes_copy = []
-        for pipe_info in pipes_data:
-            # pipe_info = (top_rect_id, bot_rect_id, passed)
-            top_id = pipe_info[0]
-            bot_id = pipe_info[1]
-            passed = pipe_info[2] if len(pipe_info) > 2 else False
-            
-            # Récupérer les coordonnées des rectangles
-            try:
-                top_coords = canvas.coords(top_id)  # [x1, y1, x2, y2]
-                bot_coords = canvas.coords(bot_id)
-                
-                if top_coords and bot_coords:
-                    pipes_copy.append({
-                        'x': top_coords[0],
-                        'top_h': top_coords[3],  # hauteur du tuyau du haut
-                        'bot_y': bot_coords[1],  # position Y du tuyau du bas
-                        'width': top_coords[2] - top_coords[0],
-                        'passed': passed
-                    })
-            except Exception as e:
-                print(f"[REPLAY] Erreur lors de la copie des coords: {e}")
-                continue
-        
-        return pipes_copy
-    
+        self.store.append(world, score)
+        if self.inputs is not None:
+            self.inputs.record_step(world)
+
+    def record_flap(self, world):
+        "Note un saut avant le prochain pas de simulation"
+        if self.is_recording and self.inputs is not None:
+            self.inputs.record_flap(world.tick)
+
+    def record_resize(self, world):
+        "Note un changement de dimensions du terrain"
+        if self.is_recording and self.inputs is not None:
+            self.inputs.record_resize(world.tick, world.width, world.height)
+
+    # ==================== Fichiers ====================
+
+    def save(self, final_score, directory=REPLAY_DIR):
+        "Sauvegarde le replay en mémoire (frames + journal d'entrées)"
+        if len(self.store) == 0:
+            return None
+        mode = self._last_game_mode or "Unknown"
+        stem = os.path.join(directory, time.strftime("replay_%Y%m%d_%H%M%S_") + mode)
+        path = stem + EXTENSION
+        try:
+            write_replay(path, self.store, mode, final_score, SIM_TICK_MS)
+            print(f"[REPLAY] Sauvegardé : {path}")
+            if self.inputs is not None:
+                write_inputs(stem + INPUT_EXTENSION, self.inputs)
+                print(f"[REPLAY] Entrées sauvegardées : {stem + INPUT_EXTENSION} "
+                      f"({len(self.inputs.flaps)} sauts)")
+            return path
+        except OSError as e:
+            print(f"[REPLAY] Sauvegarde impossible: {e}")
+            return None
+
+    @staticmethod
+    def list_saved(directory=REPLAY_DIR):
+        "Liste les replays sauvegardés (plus récent en premier)"
+        return list_replays(directory)
+
+    def load_file(self, path):
+        "Sélectionne un replay sauvegardé comme source de lecture"
+        if path.endswith(INPUT_EXTENSION):
+            return self._load_inputs(path)
+        try:
+            replay_file = ReplayFile(path)
+        except (OSError, ValueError) as e:
+            print(f"[REPLAY] Chargement impossible: {e}")
+            return False
+        self._close_file()
+        self.source = replay_file
+        self.mode = replay_file.mode
+        print(f"[REPLAY] Fichier chargé : {path} ({len(replay_file)} frames)")
+        return True
+
+    def _load_inputs(self, path):
+        "Re-simule un journal d'entrées et lit le résultat"
+        try:
+            log = read_inputs(path)
+        except (OSError, ValueError) as e:
+            print(f"[REPLAY] Chargement impossible: {e}")
+            return False
+
+        store = ReplayStore()
+        world = log.simulate(store)
+        if not log.verify(world):
+            print(f"[REPLAY] Vérification échouée : score {world.score} "
+                  f"au lieu de {log.final_score}")
+
+        self._close_file()
+        self.source = store
+        self.mode = log.mode
+        print(f"[REPLAY] Entrées re-simulées : {path} ({len(store)} frames)")
+        return True
+
+    def use_last_game(self):
+        "Revient au replay de la dernière partie (en mémoire)"
+        self._close_file()
+        self.mode = self._last_game_mode
+
+    def _close_file(self):
+        if isinstance(self.source, ReplayFile):
+            self.source.close()
+        self.source = self.store
+
+    # ==================== Lecture ====================
+
     def start_playback(self):
         "Démarre la lecture d'un replay"
-        if len(self.frames) == 0:
+        if len(self.source) == 0:
             print("[REPLAY] Aucun replay disponible")
             return False
-        
-        self.current_index = 0
+
+        self.current_index = self.source.first_frame
+        self._play_row = 0
         self.is_playing = True
         self.is_recording = False
-        print(f"[REPLAY] Lecture démarrée - {len(self.frames)} frames")
+        print(f"[REPLAY] Lecture démarrée - {len(self.source)} frames")
         return True
-    
+
     def stop_playback(self):
         "Arrête la lecture du replay"
         self.is_playing = False
         self.current_index = 0
         print("[REPLAY] Lecture arrêtée")
-    
-    def get_next_frame(self):
-        "Récupère la prochaine frame du replay"
-        if not self.is_playing or self.current_index >= len(self.frames):
+
+    def get_next_frame(self, width=None, height=None):
+        """
+        Récupère la prochaine frame du replay : (bird_y, vy, score, tuyaux).
+        Avec width/height, les hauteurs sont ramenées de l'échelle du terrain
+        enregistré à celle du terrain affiché ; les abscisses restent absolues,
+        comme dans le jeu (World.resize ne déplace ni l'oiseau ni les tuyaux).
+        """
+        source = self.source
+        if not self.is_playing or self.current_index >= source.total_frames:
             return None
-        
-        frame = self.frames[self.current_index]
+
+        f = self.current_index
+        bird_y, vy, score = source.frame(f)
+        self._play_row = source.first_row_alive_at(f, self._play_row)
+        pipes = source.pipes_at(f, self._play_row)
         self.current_index += 1
-        return frame
-    
+
+        if width is not None:
+            field_h = source.field_at(f)[1]
+            if field_h != height:
+                sy = height / field_h
+                bird_y *= sy
+                vy *= sy
+                for p in pipes:
+                    p.top_h *= sy
+                    p.bot_y *= sy
+        return bird_y, vy, score, pipes
+
     def is_replay_finished(self):
-        "Vérifie si le replay est terminé"""
-        return self.is_playing and self.current_index >= len(self.frames)
-    
+        "Vérifie si le replay est terminé"
+        return self.is_playing and self.current_index >= self.source.total_frames
+
     def has_replay(self):
         "Vérifie si un replay est disponible"
-        return len(self.frames) > 0
-    
+        return len(self.source) > 0
+
     def clear_replay(self):
         "Efface le replay en mémoire"
-        self.frames = []
+        self._close_file()
+        self.store.clear()
         self.current_index = 0
         self.is_recording = False
         self.is_playing = False
         print("[REPLAY] Replay effacé")
-    
+
     def get_progress(self):
         "Retourne le pourcentage de progression du replay"
-        if len(self.frames) == 0:
+        n = len(self.source)
+        if n == 0:
             return 0
-        return (self.current_index / len(self.frames)) * 100
\ No newline at end of file
+        return ((self.current_index - self.source.first_frame) / n) * 100
@@ -0,0 +1,144 @@
+# scheduler.py
+"""
+Ordonnanceur de frames : une seule chaîne after() pour toute l'application.
+Les frames visent des échéances absolues (horloge monotone) : le délai du
+prochain after() est raccourci du temps déjà passé, et le rendu (jamais la
+simulation) est sauté quand la boucle a plus d'une période de retard.
+"""
+
+import time
+from collections import deque
+from statistics import pstdev
+from constants import FPS_MS, MAX_RENDER_SKIP, PACING_WINDOW
+
+
+class FrameScheduler:
+    "Possède l'unique callback de frame et appelle les hooks de l'état courant"
+
+    def __init__(self, root, state_key, frame_ms=FPS_MS):
+        self.root = root
+        self.state_key = state_key      # fonction -> nom de l'état courant
+        self.frame_ms = frame_ms        # période visée (ms, peut être fractionnaire)
+        self._running = False
+        self._after_id = None
+        self._update_hooks = {}         # état -> [update]
+        self._render_hooks = {}         # état -> [render]
+        self.profiler = None            # FrameProfiler optionnel
+
+        # Cadence
+        self._deadline = 0.0            # échéance absolue de la prochaine frame (s)
+        self._last_start = None
+        self._skipped_in_row = 0
+        self._lag = 0.0                 # retard constaté à la fin de la frame précédente (s)
+        self._intervals = deque(maxlen=PACING_WINDOW)  # écarts entre frames (ms)
+
+        # Statistiques
+        self.frame_count = 0
+        self.missed_deadlines = 0
+        self.skipped_renders = 0
+        self.last_frame_ms = 0.0
+
+    def register(self, state_name: str, update=None, render=None):
+        """
+        Ajoute des hooks pour un état. Si un update renvoie False,
+        le rendu de la frame est sauté (changement d'état en cours).
+        """
+        if update is not None:
+            self._update_hooks.setdefault(state_name, []).append(update)
+        if render is not None:
+            self._render_hooks.setdefault(state_name, []).append(render)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ==================== Cadence mesurée ====================
+
+    @property
+    def fps(self) -> float:
+        "Fréquence réellement atteinte sur la fenêtre glissante"
+        if not self._intervals:
+            return 0.0
+        return 1000.0 * len(self._intervals) / sum(self._intervals)
+
+    @property
+    def jitter_ms(self) -> float:
+        "Écart-type des intervalles entre frames (ms)"
+        if len(self._intervals) < 2:
+            return 0.0
+        return pstdev(self._intervals)
+
+    # ==================== Boucle ====================
+
+    def start(self):
+        "Démarre la boucle (sans effet si elle tourne déjà)"
+        if not self._running:
+            self._running = True
+            self._last_start = None
+            self._skipped_in_row = 0
+            self._lag = 0.0
+            self._intervals.clear()
+            now = time.perf_counter()
+            self._deadline = now + self.frame_ms / 1000.0
+            self._schedule(now)
+
+    def stop(self):
+        "Arrête la boucle"
+        self._running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self, now):
+        "Programme la prochaine frame à son échéance absolue"
+        delay = max(0, int(round((self._deadline - now) * 1000.0)))
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        "Une frame : updates puis rendus de l'état courant"
+        self._after_id = None
+        t0 = time.perf_counter()
+        period = self.frame_ms / 1000.0
+
+        if self._last_start is not None:
+            self._intervals.append((t0 - self._last_start) * 1000.0)
+        self._last_start = t0
+
+        # Plus d'une période de retard : on rattrape sans dessiner
+        behind = max(self._lag, t0 - self._deadline) > period
+        if behind:
+            self.missed_deadlines += 1
+        skip_render = behind and self._skipped_in_row < MAX_RENDER_SKIP
+
+        try:
+            state = self.state_key()
+            do_render = True
+            for update in self._update_hooks.get(state, ()):
+                if update() is False:
+                    do_render = False
+                    break
+            if do_render and skip_render:
+                self.skipped_renders += 1
+                self._skipped_in_row += 1
+            elif do_render:
+                self._skipped_in_row = 0
+                t_render = time.perf_counter()
+                for render in self._render_hooks.get(state, ()):
+                    render()
+                if self.profiler is not None:
+                    self.profiler.add("render", time.perf_counter() - t_render)
+        finally:
+            self.frame_count += 1
+            now = time.perf_counter()
+            self.last_frame_ms = (now - t0) * 1000.0
+            if self.profiler is not None:
+                self.profiler.end_frame(self.last_frame_ms)
+
+            # Échéance suivante ; trop de retard -> on se recale plutôt que d'enchaîner
+            self._deadline += period
+            self._lag = now - self._deadline
+            if self._lag > period * MAX_RENDER_SKIP:
+                self._deadline = now
+            # Une exception dans un hook ne doit pas tuer la boucle
+            if self._running:
+                self._schedule(now)
@@ -0,0 +1,46 @@
+# sim_clock.py
+"""
+Horloge de simulation à pas fixe (accumulateur + interpolation du rendu)
+"""
+
+import time
+from constants import SIM_TICK_MS, MAX_SIM_STEPS
+
+
+class SimClock:
+    "Découpe le temps réel écoulé en pas de simulation de durée fixe"
+
+    def __init__(self, tick_ms=SIM_TICK_MS, max_steps=MAX_SIM_STEPS):
+        self.tick_ms = tick_ms
+        self.max_steps = max_steps
+        self.reset()
+
+    def reset(self):
+        "Repart de zéro (début de partie, sortie de pause)"
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+        self.tick = 0
+        self.dropped_ms = 0.0
+
+    def advance(self) -> int:
+        "Retourne le nombre de pas de simulation à exécuter pour cette frame"
+        now = time.perf_counter()
+        self.accumulator += (now - self.last_time) * 1000.0
+        self.last_time = now
+
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_steps:
+            # Trop de retard : on abandonne le surplus plutôt que de ramer
+            self.dropped_ms += (steps - self.max_steps) * self.tick_ms
+            steps = self.max_steps
+        self.accumulator -= steps * self.tick_ms
+        if self.accumulator >= self.tick_ms:
+            self.accumulator %= self.tick_ms
+
+        self.tick += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        "Fraction du pas en cours, pour interpoler entre les deux derniers états"
+        return self.accumulator / self.tick_ms
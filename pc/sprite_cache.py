@@ -0,0 +1,98 @@
+# sprite_cache.py
+"""
+Cache disque des sprites déjà traités (colorkey, redimensionnement).
+Un fichier par sprite : en-tête + pixels bruts, relus sans décodage PNG.
+Le nom du fichier contient une empreinte du chemin source, de sa date de
+modification, de sa taille et des paramètres de traitement : modifier
+l'asset ou une constante (clé, tolérance, taille) invalide l'entrée.
+"""
+
+import hashlib
+import os
+import struct
+from PIL import Image
+
+MAGIC = b"FBSP"
+VERSION = 1
+EXTENSION = ".px"
+# magic, version, mode (RGB/RGBA), largeur, hauteur
+HEADER = struct.Struct("<4sH4sII")
+
+
+class SpriteCache:
+    "Images PIL traitées rangées sur disque, clé (source, paramètres)"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, src_path, params):
+        "Fichier du cache pour cette source et ces paramètres"
+        st = os.stat(src_path)
+        stem = os.path.splitext(os.path.basename(src_path))[0]
+        digest = hashlib.sha1(
+            f"{VERSION}|{os.path.abspath(src_path)}|{st.st_mtime_ns}|{st.st_size}|{params!r}".encode()
+        ).hexdigest()[:16]
+        return os.path.join(self.directory, f"{stem}_{digest}{EXTENSION}")
+
+    def load(self, src_path, params, build):
+        """
+        Retourne l'image traitée de src_path. Si elle n'est pas en cache,
+        build() (-> image PIL) est appelé et son résultat écrit sur disque.
+        """
+        path = self._entry_path(src_path, params)
+        img = self._read(path)
+        if img is not None:
+            self.hits += 1
+            return img
+
+        self.misses += 1
+        img = build()
+        self._write(path, img)
+        return img
+
+    # ==================== Fichiers ====================
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, mode, w, h = HEADER.unpack_from(data)
+        mode = mode.rstrip(b"\0").decode("ascii", "replace")
+        if magic != MAGIC or version != VERSION or mode not in ("RGB", "RGBA"):
+            return None
+        if len(data) - HEADER.size != w * h * len(mode):
+            return None
+        return Image.frombytes(mode, (w, h), data[HEADER.size:])
+
+    def _write(self, path, img):
+        "Écrit l'entrée (remplacement atomique) et supprime les versions périmées"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(HEADER.pack(MAGIC, VERSION, img.mode.encode("ascii"), img.width, img.height))
+                fh.write(img.tobytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[SPRITES] Écriture du cache impossible: {e}")
+            return
+        self._drop_stale(path)
+
+    def _drop_stale(self, path):
+        "Supprime les anciennes entrées du même sprite (source ou paramètres changés)"
+        name = os.path.basename(path)
+        prefix = name[:name.rfind("_") + 1]
+        for other in os.listdir(self.directory):
+            if other != name and other.startswith(prefix) and other.endswith(EXTENSION) \
+                    and len(other) == len(name):
+                try:
+                    os.remove(os.path.join(self.directory, other))
+                except OSError:
+                    pass
@@ -0,0 +1,94 @@
+# texture_cache.py
+"""
+Cache des textures redimensionnées, clé (asset, taille, flip, mode).
+Mémoire bornée avec éviction LRU ; les nouvelles tailles sont redimensionnées
+dans un thread, l'appelant affiche un remplaçant en attendant.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from constants import TEXTURE_CACHE_MB
+
+
+class TextureCache:
+    "Textures prêtes à afficher (PhotoImage) rangées de la moins à la plus récente"
+
+    def __init__(self, make_photo, max_bytes=TEXTURE_CACHE_MB * 1024 * 1024):
+        self.make_photo = make_photo      # image PIL -> PhotoImage (thread Tk)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()     # clé -> (photo, octets)
+        self._pending = {}                # clé -> Future (image PIL)
+        self._current = {}                # (asset, mode) -> dernière clé demandée
+        self._executor = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Retourne la texture de la clé si elle est prête, sinon None.
+        Au premier appel, build() (-> image PIL) est lancé dans un thread.
+        """
+        self._current[(key[0], key[3])] = key
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        if key not in self._pending:
+            self.misses += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="textures")
+            self._pending[key] = self._executor.submit(build)
+        return None
+
+    def put(self, key, img):
+        "Ajoute une image PIL déjà prête (thread Tk)"
+        photo = self.make_photo(img)
+        size = img.width * img.height * 4
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self._entries[key] = (photo, size)
+        self.nbytes += size
+        self._evict()
+        return photo
+
+    def poll(self) -> bool:
+        "Intègre les redimensionnements terminés (thread Tk). True si du nouveau"
+        done = [k for k, fut in self._pending.items() if fut.done()]
+        for key in done:
+            fut = self._pending.pop(key)
+            try:
+                img = fut.result()
+            except Exception as e:
+                print(f"[TEXTURE] Redimensionnement impossible {key}: {e}")
+                continue
+            if img is not None:
+                self.put(key, img)
+        return bool(done)
+
+    def _evict(self):
+        "Supprime les textures les moins récentes au-delà du budget (sauf celles affichées)"
+        if self.nbytes <= self.max_bytes:
+            return
+        in_use = set(self._current.values())
+        for key in list(self._entries):
+            if self.nbytes <= self.max_bytes:
+                break
+            if key in in_use:
+                continue
+            self.nbytes -= self._entries.pop(key)[1]
+
+    def drop_mode(self, mode):
+        "Supprime les textures d'un mode (assets du mode libérés)"
+        for key in [k for k in self._entries if k[3] == mode]:
+            self.nbytes -= self._entries.pop(key)[1]
+        for key in [k for k in self._current if k[1] == mode]:
+            del self._current[key]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
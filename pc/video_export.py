@@ -0,0 +1,287 @@
+# video_export.py
+"""
+Export des replays en vidéo sans Tk : les frames sont composées dans des
+tableaux NumPy (mêmes assets que le jeu) puis écrites en PNG ou en RGB brut,
+aussi vite que le CPU le permet (option : pool de processus par plages de frames).
+
+Exemple :
+    python video_export.py replays/replay_xxx.fbr --format raw --workers 4
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 1920x1080 -r 60 -i replay_xxx.rgb replay_xxx.mp4
+
+Sans --size, la sortie a la taille du terrain enregistré ; sinon tout est mis à l'échelle.
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+from assets_manager import AssetsManager
+from replay_manager import ReplayManager
+from constants import (
+    WIDTH, HEIGHT, BIRD_X, BIRD_RADIUS, BIRD_SPRITE, SCORE_FONT, SCORE_COLOR, SIM_TICK_MS,
+    MODE_PIPE_SKINS, PIPE_WIDTH
+)
+
+CHUNKS_PER_WORKER = 4  # plages par processus (équilibrage de charge)
+
+
+class Sprite:
+    "Sprite pré-découpé pour NumPy : couleurs RGB + masque d'opacité"
+    __slots__ = ("rgb", "mask", "w", "h")
+
+    def __init__(self, img):
+        rgba = np.asarray(img.convert("RGBA"))
+        self.rgb = np.ascontiguousarray(rgba[..., :3])
+        self.mask = rgba[..., 3:4] >= 128
+        self.h, self.w = rgba.shape[:2]
+
+
+def _load_font(size):
+    "Police du score (VT323 si installée, sinon police par défaut de Pillow)"
+    try:
+        return ImageFont.truetype(f"{SCORE_FONT[0]}.ttf", size)
+    except OSError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            return ImageFont.load_default()
+
+
+class OffscreenRenderer:
+    """
+    Compose une frame de replay dans un tableau (hauteur, largeur, 3) uint8.
+    Chaque frame est dessinée dans l'espace du terrain enregistré puis ramenée
+    à la taille de sortie (positions, sprites et tuyaux mis à l'échelle).
+    """
+
+    def __init__(self, assets, mode, width=WIDTH, height=HEIGHT):
+        self.width = width
+        self.height = height
+
+        # Fond redimensionné une seule fois (le jeu l'étire sur tout le terrain)
+        bg = assets.background_src
+        if bg is not None:
+            self.background = np.asarray(bg.convert("RGB").resize((width, height), Image.LANCZOS))
+        else:
+            self.background = np.zeros((height, width, 3), dtype=np.uint8)
+
+        # Oiseau (cercle noir si le sprite est absent, comme sur le canvas)
+        bird = assets.bird_src
+        if bird is None:
+            size = BIRD_RADIUS * 2
+            bird = Image.new("RGBA", (size, size))
+            ImageDraw.Draw(bird).ellipse((0, 0, size - 1, size - 1), fill="black")
+        self._bird_src = bird
+        self._pipe_src = assets.get_pipe_textures(mode)
+
+        self._score_color = ImageColor.getrgb(SCORE_COLOR)
+        self._scales = {}         # (sx, sy) -> sprites à cette échelle
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+
+    def _scaled(self, field):
+        "Sprites pour un terrain enregistré de taille field (calculés une fois par taille)"
+        field_w, field_h = field
+        key = (self.width / field_w, self.height / field_h)
+        scaled = self._scales.get(key)
+        if scaled is None:
+            sx, sy = key
+            bird = self._bird_src
+            if (sx, sy) != (1.0, 1.0):
+                bird = bird.resize((max(1, round(bird.width * sx)), max(1, round(bird.height * sy))),
+                                   Image.LANCZOS)
+
+            # Comme le jeu : textures à (PIPE_WIDTH, hauteur du terrain), puis échelle de sortie
+            pipes = [None, None]
+            pipe_size = (max(1, round(PIPE_WIDTH * sx)), self.height)
+            for i, img in enumerate(self._pipe_src):
+                if img is not None:
+                    if img.size != pipe_size:
+                        img = img.resize(pipe_size, Image.LANCZOS)
+                    pipes[i] = Sprite(img)
+
+            scaled = self._scales[key] = {
+                "sx": sx, "sy": sy, "bird": Sprite(bird),
+                "pipe_top": pipes[0], "pipe_bot": pipes[1],
+                "font": _load_font(max(1, round(SCORE_FONT[1] * sy))), "score": {},
+            }
+        return scaled
+
+    # ==================== Primitives ====================
+
+    def fill_rect(self, x1, y1, x2, y2):
+        "Rectangle noir (hitbox des tuyaux), découpé aux bords"
+        x1, y1 = max(int(x1), 0), max(int(y1), 0)
+        x2, y2 = min(int(x2), self.width), min(int(y2), self.height)
+        if x1 < x2 and y1 < y2:
+            self.frame[y1:y2, x1:x2] = 0
+
+    def blit(self, sprite, x, y):
+        "Copie les pixels opaques du sprite, coin haut-gauche en (x, y)"
+        x, y = int(x), int(y)
+        sx1, sy1 = max(0, -x), max(0, -y)
+        sx2 = min(sprite.w, self.width - x)
+        sy2 = min(sprite.h, self.height - y)
+        if sx1 >= sx2 or sy1 >= sy2:
+            return
+        np.copyto(
+            self.frame[y + sy1:y + sy2, x + sx1:x + sx2],
+            sprite.rgb[sy1:sy2, sx1:sx2],
+            where=sprite.mask[sy1:sy2, sx1:sx2]
+        )
+
+    @staticmethod
+    def _score_sprite(scaled, score, color):
+        sprite = scaled["score"].get(score)
+        if sprite is None:
+            text = f"Score : {score}"
+            font = scaled["font"]
+            left, top, right, bottom = font.getbbox(text)
+            img = Image.new("RGBA", (right - left, bottom - top))
+            ImageDraw.Draw(img).text((-left, -top), text, font=font, fill=color)
+            sprite = scaled["score"][score] = Sprite(img)
+        return sprite
+
+    # ==================== Frame ====================
+
+    def render(self, bird_y, score, pipes, field=None):
+        "Compose une frame (même disposition que le canvas) et la retourne"
+        field = field or (self.width, self.height)
+        scaled = self._scaled(field)
+        sx, sy = scaled["sx"], scaled["sy"]
+        np.copyto(self.frame, self.background)
+        h = self.height
+        top_sprite, bot_sprite = scaled["pipe_top"], scaled["pipe_bot"]
+
+        for pipe in pipes:
+            x = int(round(pipe.x * sx))
+            x2 = int(round((pipe.x + pipe.width) * sx))
+            top_h = int(round(pipe.top_h * sy))
+            bot_y = int(round(pipe.bot_y * sy))
+            self.fill_rect(x, 0, x2, top_h)
+            self.fill_rect(x, bot_y, x2, h)
+            if top_sprite is not None:
+                self.blit(top_sprite, x, top_h - top_sprite.h)  # ancre sw
+            if bot_sprite is not None:
+                self.blit(bot_sprite, x, bot_y)                  # ancre nw
+
+        bird = scaled["bird"]
+        self.blit(bird, round(BIRD_X * sx) - bird.w // 2, int(bird_y * sy) - bird.h // 2)
+
+        text = self._score_sprite(scaled, score, self._score_color)
+        self.blit(text, round(field[0] // 2 * sx) - text.w // 2, round(50 * sy) - text.h // 2)
+        return self.frame
+
+
+# ==================== Export ====================
+
+_worker = {}  # état d'un processus d'export (replay ouvert + renderer)
+
+
+def _init_worker(path, size):
+    "Ouvre le replay et prépare les assets une seule fois par processus"
+    replay = ReplayManager()
+    if not replay.load_file(path):
+        raise ValueError(f"Replay illisible : {path}")
+    assets = AssetsManager(headless=True)
+    assets.load_bird_sprite(BIRD_SPRITE)
+    assets.load_background()
+    assets.load_pipe_textures(replay.mode if replay.mode in MODE_PIPE_SKINS else "Button")
+    _worker["replay"] = replay
+    _worker["renderer"] = OffscreenRenderer(assets, replay.mode, *size)
+
+
+def _export_range(job):
+    "Écrit les frames de sortie [start, stop) (exécuté dans un processus)"
+    start, stop, out, fmt, step = job
+    source = _worker["replay"].source
+    renderer = _worker["renderer"]
+    first = source.first_frame
+    row = 0
+
+    raw = None
+    if fmt == "raw":
+        raw = open(out, "r+b")
+        raw.seek(start * renderer.frame.nbytes)
+    try:
+        for k in range(start, stop):
+            f = first + k * step
+            bird_y, _, score = source.frame(f)
+            row = source.first_row_alive_at(f, row)
+            frame = renderer.render(bird_y, score, source.pipes_at(f, row), source.field_at(f))
+            if raw is not None:
+                raw.write(frame.data)
+            else:
+                Image.fromarray(frame).save(
+                    os.path.join(out, f"frame_{k:06d}.png"), compress_level=1
+                )
+    finally:
+        if raw is not None:
+            raw.close()
+    return stop - start
+
+
+def export_replay(path, out=None, fmt="png", workers=1, size=None, step=1, verbose=True):
+    """
+    Exporte un replay sauvegardé (.fbr ou .fbi). Retourne le nombre de frames écrites.
+    Sans size, la vidéo a la taille du terrain enregistré (première frame).
+    """
+    replay = ReplayManager()
+    if not replay.load_file(path):
+        return 0
+    source = replay.source
+    n_src = len(source)
+    size = tuple(size) if size else tuple(source.field_at(source.first_frame))
+    replay.use_last_game()
+
+    n_out = (n_src + step - 1) // step
+    width, height = size
+    stem = os.path.splitext(path)[0]
+    if fmt == "raw":
+        out = out or stem + ".rgb"
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+        with open(out, "wb") as fh:
+            fh.truncate(n_out * width * height * 3)  # chaque processus écrit à sa place
+    else:
+        out = out or stem + "_frames"
+        os.makedirs(out, exist_ok=True)
+
+    n_chunks = max(1, workers * CHUNKS_PER_WORKER)
+    bounds = np.linspace(0, n_out, n_chunks + 1).astype(int)
+    jobs = [(int(a), int(b), out, fmt, step) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+    t0 = time.perf_counter()
+    if workers > 1:
+        with Pool(workers, initializer=_init_worker, initargs=(path, size)) as pool:
+            written = sum(pool.imap_unordered(_export_range, jobs))
+    else:
+        _init_worker(path, size)
+        written = sum(_export_range(job) for job in jobs)
+    elapsed = time.perf_counter() - t0
+
+    if verbose:
+        fps = 1000.0 / SIM_TICK_MS / step
+        print(f"[EXPORT] {written} frames -> {out} en {elapsed:.1f} s "
+              f"({written / max(elapsed, 1e-9):.0f} frames/s)")
+        if fmt == "raw":
+            print(f"[EXPORT] ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} "
+                  f"-r {fps:g} -i {out} {stem}.mp4")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export d'un replay en images ou vidéo brute")
+    parser.add_argument("replay", help="fichier .fbr ou .fbi")
+    parser.add_argument("--out", default=None, help="dossier (png) ou fichier (raw)")
+    parser.add_argument("--format", choices=("png", "raw"), default="png")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--size", type=int, nargs=2, default=None, metavar=("W", "H"),
+                        help="taille de sortie (défaut : terrain enregistré, mis à l'échelle sinon)")
+    parser.add_argument("--step", type=int, default=1, help="garde une frame sur N")
+    args = parser.parse_args()
+    export_replay(args.replay, args.out, args.format, args.workers, args.size, args.step)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# world.py
+"""
+Modèle du monde (oiseau + tuyaux) indépendant de Tkinter.
+Le canvas ne fait que refléter cet état.
+"""
+
+import random
+from collections import deque
+from time import perf_counter
+from physics import PhysicsEngine
+from constants import (
+    WIDTH, HEIGHT, PIPE_WIDTH, PIPE_GAP_BASE, PIPE_GAP_MIN,
+    PIPE_GAP_JITTER, PIPE_CENTER_MIN_FRAC, PIPE_CENTER_MAX_FRAC,
+    PIPE_CENTER_DELTA_MINF, PIPE_SPEED_BASE, PIPE_SPEED_MAX,
+    PIPE_SPAWN_EVERY_MS, BIRD_X
+)
+
+
+class Pipe:
+    "Paire de tuyaux sous forme de simples valeurs numériques"
+    __slots__ = ("id", "x", "prev_x", "top_h", "bot_y", "width", "passed")
+
+    def __init__(self, pipe_id, x, top_h, bot_y, width=PIPE_WIDTH):
+        self.id = pipe_id
+        self.x = x
+        self.prev_x = x
+        self.top_h = top_h
+        self.bot_y = bot_y
+        self.width = width
+        self.passed = False
+
+
+class World:
+    "État de la partie (oiseau, tuyaux, score) avancé par step()"
+
+    def __init__(self, width=WIDTH, height=HEIGHT, gap=None):
+        self.width = width
+        self.height = height
+        # Gap imposé (expériences IA sur le rapport h/w), None = gap dynamique
+        self.gap = gap
+        # FrameProfiler optionnel (temps par phase du pas), None = pas de mesure
+        self.profiler = None
+        self.reset()
+
+    def reset(self, seed=None):
+        "Remet le monde à zéro (oiseau au centre, aucun tuyau)"
+        # Générateur propre à la partie : même graine = mêmes tuyaux
+        self.seed = random.randrange(1 << 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.tick = 0  # nombre de pas simulés
+
+        self.bird_y = self.height // 2
+        self.prev_bird_y = self.bird_y
+        self.vy = 0.0
+        self.crashed = False
+
+        # Tuyaux triés par x croissant (spawn à droite, suppression à gauche)
+        self.pipes = deque()
+        self.last_gap_center = None
+        self._next_pipe_id = 0
+
+        self.score = 0
+        self.scroll = 0.0  # défilement cumulé des tuyaux (replays)
+
+        # Paramètres dynamiques
+        self.pipe_gap = PIPE_GAP_BASE
+        self.pipe_speed = PIPE_SPEED_BASE
+        self.spawn_every_ms = PIPE_SPAWN_EVERY_MS
+        self.spawn_elapsed_ms = 0.0
+
+    def new_game(self, width: int, height: int, seed=None):
+        "Démarre une partie : oiseau au centre et premier tuyau placé"
+        self.reset(seed)
+        self.resize(width, height)
+        self.bird_y = self.prev_bird_y = self.height // 2
+        self.spawn_pipe_pair(initial=True)
+
+    def resize(self, width: int, height: int):
+        "Met à jour les dimensions du terrain"
+        if width > 1 and height > 1:
+            self.width = width
+            self.height = height
+
+    # ==================== Oiseau ====================
+
+    def flap(self):
+        "Fait sauter l'oiseau"
+        self.vy = PhysicsEngine.apply_flap()
+
+    # ==================== Tuyaux ====================
+
+    def calculate_dynamic_gap(self) -> int:
+        "Calcule le gap dynamique en fonction du score"
+        if self.gap is not None:
+            return self.gap
+        base = max(PIPE_GAP_MIN, self.pipe_gap - self.score * 2)
+        jitter = self.rng.randint(-PIPE_GAP_JITTER, PIPE_GAP_JITTER)
+        return max(PIPE_GAP_MIN, base + jitter)
+
+    def spawn_pipe_pair(self, initial=False):
+        "Ajoute une paire de tuyaux à droite de l'écran"
+        h = self.height
+
+        # Calcul du gap et du centre
+        gap = self.calculate_dynamic_gap()
+
+        min_c = int(h * PIPE_CENTER_MIN_FRAC)
+        max_c = int(h * PIPE_CENTER_MAX_FRAC)
+        min_delta = int(h * PIPE_CENTER_DELTA_MINF)
+
+        rng = self.rng
+        if self.last_gap_center is None:
+            gap_center = rng.randint(min_c, max_c)
+        else:
+            if rng.random() < 0.5:
+                gap_center = rng.randint(
+                    min_c, max(self.last_gap_center - min_delta, min_c)
+                )
+            else:
+                gap_center = rng.randint(
+                    min(self.last_gap_center + min_delta, max_c), max_c
+                )
+
+            if abs(gap_center - self.last_gap_center) < min_delta:
+                for _ in range(8):
+                    candidate = rng.randint(min_c, max_c)
+                    if abs(candidate - self.last_gap_center) >= min_delta:
+                        gap_center = candidate
+                        break
+
+        self.last_gap_center = gap_center
+
+        top_h = max(40, gap_center - gap // 2)
+        bot_y = gap_center + gap // 2
+
+        # Position X
+        x = (self.width + PIPE_WIDTH) if not initial else (self.width + 30)
+
+        pipe = Pipe(self._next_pipe_id, x, top_h, bot_y)
+        self._next_pipe_id += 1
+        self.pipes.append(pipe)
+        return pipe
+
+    def move_pipes(self) -> int:
+        "Déplace tous les tuyaux, supprime ceux hors écran et gère le scoring"
+        return_val = 0
+        dx = -self.pipe_speed
+
+        self.scroll -= dx
+        for pipe in self.pipes:
+            pipe.x += dx
+
+            # Comptage du score
+            if not pipe.passed and pipe.x + pipe.width < BIRD_X:
+                pipe.passed = True
+                self.score += 1
+                self.pipe_speed = min(PIPE_SPEED_MAX, self.pipe_speed + 0.05)
+                return_val = 1
+
+        # Suppression des tuyaux hors écran (toujours en tête de file)
+        pipes = self.pipes
+        while pipes and pipes[0].x + pipes[0].width < 0:
+            pipes.popleft()
+
+        return return_val
+
+    def advance_pipes(self, dt_ms: float) -> int:
+        "Spawn éventuel puis déplacement des tuyaux (partie du pas sans l'oiseau)"
+        self.spawn_elapsed_ms += dt_ms
+        if self.spawn_elapsed_ms >= self.spawn_every_ms:
+            self.spawn_pipe_pair()
+            self.spawn_elapsed_ms = 0.0
+
+        return self.move_pipes()
+
+    # ==================== Simulation ====================
+
+    def interp_bird_y(self, alpha: float) -> float:
+        "Position de l'oiseau interpolée entre les deux derniers pas"
+        return self.prev_bird_y + (self.bird_y - self.prev_bird_y) * alpha
+
+    def step(self, dt_ms: float) -> int:
+        "Avance la simulation d'un pas. Retourne 1 si un point a été marqué"
+        prof = self.profiler
+        if prof is not None:
+            t0 = perf_counter()
+        self.tick += 1
+
+        # Mémorisation de l'état précédent (interpolation du rendu)
+        self.prev_bird_y = self.bird_y
+        for pipe in self.pipes:
+            pipe.prev_x = pipe.x
+
+        # Gravité
+        self.vy = PhysicsEngine.apply_gravity(self.vy)
+        self.bird_y += self.vy
+
+        # Collision avec les bords
+        if PhysicsEngine.check_bounds_collision(self.bird_y, self.height):
+            self.crashed = True
+            if prof is not None:
+                prof.add("physics", perf_counter() - t0)
+            return 0
+
+        if prof is not None:
+            t1 = perf_counter()
+            prof.add("physics", t1 - t0)
+
+        # Spawn et déplacement des tuyaux
+        scored = self.advance_pipes(dt_ms)
+
+        if prof is not None:
+            t2 = perf_counter()
+            prof.add("pipes", t2 - t1)
+
+        # Collision avec les tuyaux
+        if PhysicsEngine.check_pipe_collision(self.bird_y, self.pipes, self.height):
+            self.crashed = True
+
+        if prof is not None:
+            prof.add("collision", perf_counter() - t2)
+        return scored
@@ -1,55 +1,77 @@
+import argparse
+import os
+import sys
+
 import matplotlib
 matplotlib.use('TkAgg')
 
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Le moteur du jeu (physique + générateur de tuyaux) est dans pc/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "pc"))
+
+from constants import BIRD_RADIUS
+from neat_trainer import train, POPULATION_SIZE, GEN_TIME_BUDGET_S
+
 # Ratios h/w à tester (hauteur du trou / taille de l’oiseau)
 ratios = np.array([1.0, 1.2, 1.5, 2, 3, 4, 6])
 
-# Paramètres de simulation
+# Paramètres de l'entraînement
 target_score = 30          # score cible : 30 tuyaux franchis
-max_score = 50             # score maximum possible
-base_learning_rate = 0.0004  # vitesse d'apprentissage de base
-
-# Fonction simulant l'évolution du score moyen au fil des générations
-def simulate_learning_curve(ratio):
-    generations = np.arange(0, 3000, 50)
-    learning_rate = base_learning_rate * ratio**1.4
-    score = max_score / (1 + np.exp(-learning_rate * (generations - 1000)))
-    noise = np.random.normal(0, 0.8, len(score))
-    return generations, np.clip(score + noise, 0, max_score)
-
-# Calcul du temps (en générations) pour atteindre le score cible
-learning_times = []
-for ratio in ratios:
-    generations, scores = simulate_learning_curve(ratio)
-    # Trouver la première génération où le score dépasse 30
-    try:
-        gen_to_reach_target = generations[np.where(scores >= target_score)[0][0]]
-    except IndexError:
-        gen_to_reach_target = np.nan  # si jamais le score n'est pas atteint
-    learning_times.append(gen_to_reach_target)
-
-# --- Figure 1 : évolution du score moyen ---
-plt.figure(figsize=(9,5))
-for ratio in ratios:
-    generations, scores = simulate_learning_curve(ratio)
-    plt.plot(generations, scores, label=f"h/w = {ratio}")
-plt.title("Évolution du score moyen selon le rapport h/w")
-plt.xlabel("Générations")
-plt.ylabel("Score moyen (tuyaux franchis)")
-plt.legend(title="Rapport h/w")
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# --- Figure 2 : temps moyen pour atteindre le score cible ---
-plt.figure(figsize=(7,5))
-plt.plot(ratios, learning_times, 'o-', color='orange', linewidth=2, markersize=8)
-plt.title(f"Temps moyen pour atteindre un score de {target_score} selon h/w")
-plt.xlabel("Rapport h/w (hauteur du trou / taille de l'oiseau)")
-plt.ylabel("Nombre de générations nécessaires")
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+max_generations = 200      # arrêt si le score cible n'est pas atteint
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entraînement NEAT réel selon le rapport h/w")
+    parser.add_argument("--generations", type=int, default=max_generations)
+    parser.add_argument("--population", type=int, default=POPULATION_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--budget", type=float, default=GEN_TIME_BUDGET_S,
+                        help="budget de temps par génération (s)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ratios", type=float, nargs="*", default=list(ratios))
+    args = parser.parse_args()
+
+    # Entraînement réel pour chaque ratio (hauteur du trou = ratio x diamètre)
+    curves = {}
+    learning_times = []
+    for ratio in args.ratios:
+        gap = int(round(ratio * 2 * BIRD_RADIUS))
+        history, reached = train(
+            gap, generations=args.generations, pop_size=args.population,
+            target=target_score, budget_s=args.budget,
+            workers=args.workers, seed=args.seed
+        )
+        curves[ratio] = history
+        # Nombre de générations pour atteindre le score cible (nan si jamais)
+        learning_times.append(np.nan if reached is None else reached)
+        print(f"h/w = {ratio} : {reached} générations")
+
+    # --- Figure 1 : évolution du score moyen ---
+    plt.figure(figsize=(9,5))
+    for ratio, history in curves.items():
+        generations = [g for g, _, _ in history]
+        scores = [m for _, _, m in history]
+        plt.plot(generations, scores, label=f"h/w = {ratio}")
+    plt.title("Évolution du score moyen selon le rapport h/w")
+    plt.xlabel("Générations")
+    plt.ylabel("Score moyen (tuyaux franchis)")
+    plt.legend(title="Rapport h/w")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+    # --- Figure 2 : temps pour atteindre le score cible ---
+    plt.figure(figsize=(7,5))
+    plt.plot(args.ratios, learning_times, 'o-', color='orange', linewidth=2, markersize=8)
+    plt.title(f"Générations pour atteindre un score de {target_score} selon h/w")
+    plt.xlabel("Rapport h/w (hauteur du trou / taille de l'oiseau)")
+    plt.ylabel("Nombre de générations nécessaires")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()